@@ -0,0 +1,54 @@
+"""Helpers for inserting many rows into the submission database at once."""
+
+import itertools
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import sqlalchemy as sa
+from sqlmodel import Session, SQLModel
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def column_values(obj: SQLModel) -> dict[str, Any]:
+    """
+    Return the field values of a table model instance as a row for insert_in_batches.
+
+    Unlike model_dump, values are not passed through field serializers.
+    Unset primary keys are left out so that the database can generate them.
+    """
+    primary_keys = {column.key for column in type(obj).__table__.primary_key}  # type: ignore[attr-defined]
+    return {
+        field: value
+        for field in type(obj).model_fields
+        if (value := getattr(obj, field)) is not None or field not in primary_keys
+    }
+
+
+def insert_in_batches(
+    session: Session,
+    model: type[SQLModel],
+    rows: Iterable[Mapping[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Insert rows into the table of the given table model using executemany, one batch at a time.
+
+    Bypasses the ORM unit of work, so the rows must already be valid for the table.
+    Committing is left to the caller.
+
+    Args:
+        session: Session to execute the inserts in.
+        model: Table model whose table the rows are inserted into.
+        rows: Column name to value mappings, one per row.
+        batch_size: Maximum number of rows sent to the database per statement.
+
+    Returns:
+        The number of rows inserted.
+    """
+    statement = sa.insert(model)
+    num_inserted = 0
+    for batch in itertools.batched(rows, batch_size):
+        session.execute(statement, list(batch))
+        num_inserted += len(batch)
+    return num_inserted
@@ -1,6 +1,10 @@
 import datetime
 import enum
+import functools
 import logging
+from typing import Annotated
+
+from pydantic import PlainSerializer
 
 log = logging.getLogger(__name__)
 
@@ -17,9 +21,7 @@ class CaseInsensitiveStrEnum(enum.StrEnum):
         e.g., MyEnum('value') will match MyEnum.VALUE.
         """
         if isinstance(value, str):
-            for member in cls:
-                if member.value.casefold() == value.casefold():
-                    return member
+            return _casefolded_members(cls).get(value.casefold())
         return None
 
     def __eq__(self, other):
@@ -39,6 +41,12 @@ class CaseInsensitiveStrEnum(enum.StrEnum):
         return hash(self.value.casefold())
 
 
+@functools.cache
+def _casefolded_members[E: CaseInsensitiveStrEnum](cls: type[E]) -> dict[str, E]:
+    """Map the casefolded values of an enum to its members, built once per enum on first lookup."""
+    return {member.value.casefold(): member for member in cls}
+
+
 class ListableEnum(enum.StrEnum):
     """Mixin for enum classes whose members can be listed."""
 
@@ -48,6 +56,11 @@ class ListableEnum(enum.StrEnum):
         return list(map(lambda c: c.value, cls))
 
 
+def utc_now() -> datetime.datetime:
+    """Current time in UTC, the default timestamp of logs and results."""
+    return datetime.datetime.now(datetime.UTC)
+
+
 def serialize_datetime_to_iso_z(dt: datetime.datetime) -> str:
     """
     Serializes a datetime object to a canonical ISO 8601 string format with 'Z' for UTC.
@@ -59,3 +72,10 @@ def serialize_datetime_to_iso_z(dt: datetime.datetime) -> str:
         dt = dt.astimezone(datetime.UTC)
 
     return dt.isoformat()
+
+
+IsoZDatetime = Annotated[
+    datetime.datetime,
+    # only when dumping to JSON (e.g. for signing), python-mode dumps keep the datetime as is
+    PlainSerializer(serialize_datetime_to_iso_z, return_type=str, when_used="json-unless-none"),
+]
@@ -0,0 +1,50 @@
+"""detailed QC results surrogate key
+
+Revision ID: 08b9d12d1fbc
+Revises: fb3df229a77b
+Create Date: 2026-10-16 18:52:47.747986+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "08b9d12d1fbc"
+down_revision: str | Sequence[str] | None = "fb3df229a77b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # replace the wide (submission_id, lab_datum_id, timestamp) primary key
+    # with an integer surrogate key and keep the old key as a unique constraint
+    natural_key = ["submission_id", "lab_datum_id", "timestamp"]
+    if op.get_context().dialect.name == "postgresql":
+        # one ALTER TABLE so the table is rewritten and scanned once for all changes
+        op.execute(
+            "ALTER TABLE detailed_qc_results"
+            " DROP CONSTRAINT detailed_qc_results_pkey,"
+            " ADD COLUMN id BIGINT GENERATED BY DEFAULT AS IDENTITY NOT NULL,"
+            " ADD CONSTRAINT detailed_qc_results_pkey PRIMARY KEY (id),"
+            f" ADD CONSTRAINT uq_detailed_qc_results UNIQUE ({', '.join(natural_key)})"
+        )
+    else:
+        # SQLite can't alter a primary key, so the table is recreated from its
+        # current definition without the old key; existing rows are numbered
+        # automatically by the new INTEGER PRIMARY KEY
+        existing_table = sa.Table("detailed_qc_results", sa.MetaData(), autoload_with=op.get_bind())
+        for column in existing_table.primary_key.columns:
+            column.primary_key = False
+        with op.batch_alter_table("detailed_qc_results", copy_from=existing_table, recreate="always") as batch_op:
+            batch_op.add_column(sa.Column("id", sa.Integer(), nullable=False), insert_before="submission_id")
+            batch_op.create_primary_key("detailed_qc_results_pkey", ["id"])
+            batch_op.create_unique_constraint("uq_detailed_qc_results", natural_key)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    raise RuntimeError("Downgrades not supported.")
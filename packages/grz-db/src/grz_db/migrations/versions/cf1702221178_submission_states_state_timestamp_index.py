@@ -0,0 +1,33 @@
+"""submission states state timestamp index
+
+Revision ID: cf1702221178
+Revises: fe717a273e57
+Create Date: 2026-10-16 19:05:35.983669+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "cf1702221178"
+down_revision: str | Sequence[str] | None = "fe717a273e57"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # serves filtering states by type within a time window, e.g. for reporting;
+    # the submission ID lets the processed submissions be read from the index alone
+    op.create_index(
+        "ix_submission_states_state_timestamp",
+        "submission_states",
+        ["state", "timestamp", "submission_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    raise RuntimeError("Downgrades not supported.")
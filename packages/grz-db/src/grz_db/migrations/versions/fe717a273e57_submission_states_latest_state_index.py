@@ -0,0 +1,33 @@
+"""submission states latest state index
+
+Revision ID: fe717a273e57
+Revises: 08b9d12d1fbc
+Create Date: 2026-10-16 19:01:33.694760+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "fe717a273e57"
+down_revision: str | Sequence[str] | None = "08b9d12d1fbc"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # lets the latest state of a submission be found by reading the end of
+    # one index range instead of sorting all of its states
+    op.create_index(
+        "ix_submission_states_submission_timestamp",
+        "submission_states",
+        ["submission_id", "timestamp"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    raise RuntimeError("Downgrades not supported.")
@@ -1,7 +1,9 @@
 import functools
 import logging
+from getpass import getpass
 
-from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from cryptography.hazmat.primitives.serialization import load_ssh_private_key
 
 log = logging.getLogger(__name__)
 
@@ -15,16 +17,13 @@ class Author:
     # cache to avoid asking for passphrase multiple times if needed
     @functools.cache  # noqa: B019
     def private_key(self) -> Ed25519PrivateKey:
-        from functools import partial
-        from getpass import getpass
-
-        from cryptography.hazmat.primitives.serialization import load_ssh_private_key
-
         passphrase = self.private_key_passphrase
         if passphrase is not None:
             passphrase_callback = lambda: passphrase
         else:
-            passphrase_callback = partial(getpass, prompt=f"Passphrase for GRZ DB author ({self.name}'s) private key: ")
+            passphrase_callback = functools.partial(
+                getpass, prompt=f"Passphrase for GRZ DB author ({self.name}'s) private key: "
+            )
 
         log.info(f"Loading private key of {self.name}…")
         try:
@@ -40,3 +39,7 @@ class Author:
         if not isinstance(private_key, Ed25519PrivateKey):
             raise TypeError(f"private_key must be an Ed25519PrivateKey. Got {type(private_key)}")
         return private_key
+
+    @functools.cache  # noqa: B019
+    def public_key(self) -> Ed25519PublicKey:
+        return self.private_key().public_key()
@@ -1,14 +1,29 @@
+import functools
 import logging
 from typing import Any, ClassVar
 
 import cryptography
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from cryptography.hazmat.primitives.serialization import load_ssh_public_key
 from pydantic import ConfigDict
 from sqlmodel import SQLModel
 
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def load_public_key(data: bytes) -> Ed25519PublicKey:
+    """
+    Load an Ed25519 public key in OpenSSH format.
+
+    Cached so that verifying many logs against the same key material only parses it once.
+    """
+    public_key = load_ssh_public_key(data)
+    if not isinstance(public_key, Ed25519PublicKey):
+        raise TypeError(f"public key must be an Ed25519PublicKey. Got {type(public_key)}")
+    return public_key
+
+
 class BaseSignablePayload(SQLModel):
     """
     Base class for SQLModel based payloads
@@ -25,15 +40,21 @@ class BaseSignablePayload(SQLModel):
         """
         Default serialization: JSON string encoded to UTF-8.
         """
-        payload_json = self.model_dump_json(by_alias=True)
-        return payload_json.encode("utf8")
+        # same JSON as model_dump_json, but as the UTF-8 bytes pydantic-core produces without a decode/encode round-trip
+        return self.__pydantic_serializer__.to_json(self, by_alias=True)
+
+    def sign(self, private_key: Ed25519PrivateKey, public_key: Ed25519PublicKey | None = None) -> bytes:
+        """
+        Sign this payload using the given private key.
 
-    def sign(self, private_key: Ed25519PrivateKey) -> bytes:
-        """Sign this payload using the given private key."""
+        The signature is verified against `public_key` before it is returned.
+        Pass it when signing repeatedly with the same key to avoid deriving it from the private key every time.
+        """
         bytes_to_sign = self.to_bytes()
         signature = private_key.sign(bytes_to_sign)
-        public_key_of_private = private_key.public_key()
-        public_key_of_private.verify(signature, bytes_to_sign)
+        if public_key is None:
+            public_key = private_key.public_key()
+        public_key.verify(signature, bytes_to_sign)
         return signature
 
 
@@ -47,6 +68,7 @@ class VerifiableLog[P: BaseSignablePayload]:
 
     signature: str
     _payload_model_class: ClassVar  # ClassVar[P] or ClassVar[type[P]] are invalid, see https://typing.python.org/en/latest/spec/class-compat.html#classvar
+    _payload_field_names: ClassVar[frozenset[str]]
 
     def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: D105
         super().__init_subclass__(**kwargs)
@@ -59,6 +81,8 @@ class VerifiableLog[P: BaseSignablePayload]:
                 f"'_payload_model_class' in {cls.__name__} must be a class and a subclass of BaseSignedPayload. "
                 f"Got: {payload_class}"
             )
+        # computed once here so verify() doesn't have to rebuild a field set on every call
+        cls._payload_field_names = frozenset(payload_class.model_fields)
 
     def verify(self, public_key: Ed25519PublicKey) -> bool:
         """Verify the signature of this log entry."""
@@ -67,8 +91,8 @@ class VerifiableLog[P: BaseSignablePayload]:
             return False
 
         signature_bytes = bytes.fromhex(self.signature)
-        data_for_payload = self.model_dump(by_alias=True, exclude={"signature", "_payload_model_class"})  # type: ignore[attr-defined]
-        payload_to_verify = self._payload_model_class(**data_for_payload)
+        data_for_payload = self.model_dump(by_alias=True, include=self._payload_field_names)  # type: ignore[attr-defined]
+        payload_to_verify = self._payload_model_class.model_validate(data_for_payload)
         bytes_to_verify = payload_to_verify.to_bytes()
 
         try:
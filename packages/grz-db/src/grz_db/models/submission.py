@@ -1,14 +1,14 @@
 import datetime
-from collections.abc import Generator, Sequence
+import enum
+import functools
+import itertools
+import re
+from collections.abc import Generator, Iterable, Iterator, Sequence
 from contextlib import contextmanager
-from operator import attrgetter
-from typing import Any, ClassVar, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
+import pydantic_core
 import sqlalchemy as sa
-from alembic import command as alembic_command
-from alembic.config import Config as AlembicConfig
-from alembic.runtime.migration import MigrationContext
-from alembic.script import ScriptDirectory as AlembicScriptDirectory
 from grz_pydantic_models.submission.metadata import (
     CoverageType,
     DiseaseType,
@@ -24,27 +24,42 @@ from grz_pydantic_models.submission.metadata import (
     SubmitterId,
     Tan,
 )
-from pydantic import ConfigDict, field_serializer, field_validator
-from sqlalchemy import JSON, Column
+from pydantic import ConfigDict, field_validator
+from sqlalchemy import JSON, Column, lambda_stmt
 from sqlalchemy import func as sqlfn
+from sqlalchemy.dialects.postgresql import Insert as PostgresqlInsert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import Insert as SqliteInsert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, joinedload, noload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_attribute
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlmodel import DateTime, Field, Relationship, Session, SQLModel, create_engine, select
+from sqlmodel.sql.expression import SelectOfScalar
 
+from ..bulk import DEFAULT_BATCH_SIZE, column_values, insert_in_batches
 from ..common import (
     CaseInsensitiveStrEnum,
+    IsoZDatetime,
     ListableEnum,
-    serialize_datetime_to_iso_z,
+    utc_now,
 )
 from ..errors import DuplicateSubmissionError, DuplicateTanGError, SubmissionNotFoundError
 from .author import Author
 from .base import BaseSignablePayload, VerifiableLog
 
+if TYPE_CHECKING:
+    from alembic.config import Config as AlembicConfig
+
 
 class OutdatedDatabaseSchemaError(Exception):
     pass
 
 
+_SUBMISSION_ID_RE = re.compile(r"^[0-9]{9}_\d{4}-\d{2}-\d{2}_[a-f0-9]{8}$")
+
+
 class SubmissionStateEnum(CaseInsensitiveStrEnum, ListableEnum):  # type: ignore[misc]
     """Submission state enum."""
 
@@ -74,6 +89,22 @@ class SemicolonSeparatedStringSet(sa.types.TypeDecorator):
 
     cache_ok = True
 
+    def __init__(self, *args: Any, element_enum: type[enum.StrEnum] | None = None, **kwargs: Any):
+        """
+        Args:
+            element_enum: Enum of all values the set may contain.
+                If given, its values are checked for semicolons once here instead of on every write.
+        """
+        super().__init__(*args, **kwargs)
+        if element_enum is not None:
+            for member in element_enum:
+                if ";" in member.value:
+                    raise ValueError(
+                        f"Cannot safely serialize {element_enum.__name__} value '{member.value}' "
+                        "in a semicolon-separated set since it contains a semicolon."
+                    )
+        self.element_enum = element_enum
+
     @property
     def python_type(self):
         return set
@@ -83,24 +114,30 @@ class SemicolonSeparatedStringSet(sa.types.TypeDecorator):
             # empty sets are stored as null to distinguish from a set of a single empty string
             return None
 
-        for s in value:
-            if ";" in s:
-                raise ValueError(
-                    f"Cannot safely serialize string '{s}' in a semicolon-separated set since it contains a semicolon."
-                )
+        if self.element_enum is None:
+            for s in value:
+                if ";" in s:
+                    raise ValueError(
+                        f"Cannot safely serialize string '{s}' in a semicolon-separated set since it contains a semicolon."
+                    )
 
         # sort the set for consistent serialization behavior / deterministic output
         return ";".join(sorted(value))
 
     def process_result_value(self, value: str | None, dialect: sa.engine.Dialect) -> set[str] | None:
-        return None if value is None else set(value.split(";"))
+        if value is None:
+            return None
+        if self.element_enum is None:
+            return set(value.split(";"))
+        # loaded rows are not validated, so convert to members here while splitting
+        return set(map(self.element_enum, value.split(";")))
 
 
 class SubmissionBase(SQLModel):
     """Submission base model."""
 
     model_config = ConfigDict(validate_assignment=True)  # type: ignore
-    immutable_fields: ClassVar[set[str]] = {"id"}
+    immutable_fields: ClassVar[frozenset[str]] = frozenset({"id"})
 
     id: str
     tan_g: Tan | None = Field(default=None, unique=True, index=True, alias="tanG")
@@ -122,6 +159,9 @@ class SubmissionBase(SQLModel):
     genomic_study_subtype: GenomicStudySubtype | None = None
 
 
+_MUTABLE_SUBMISSION_FIELDS: frozenset[str] = frozenset(SubmissionBase.model_fields) - SubmissionBase.immutable_fields
+
+
 class Submission(SubmissionBase, table=True):
     """Submission table model."""
 
@@ -133,21 +173,37 @@ class Submission(SubmissionBase, table=True):
     @field_validator("id")
     @classmethod
     def validate_id_pattern(cls, v: str) -> str:
-        import re
-
-        pattern = r"^[0-9]{9}_\d{4}-\d{2}-\d{2}_[a-f0-9]{8}$"
-        if not re.match(pattern, v):
+        if not _SUBMISSION_ID_RE.match(v):
             raise ValueError(f"Submission ID '{v}' does not match the required pattern.")
         return v
 
-    states: list["SubmissionStateLog"] = Relationship(back_populates="submission")
+    # loaded in chronological order, with ties broken by insertion order like SubmissionDb.get_latest_state;
+    # the state history is needed by most callers, so it is batch-loaded with the submissions by default,
+    # while change requests must be requested explicitly (e.g. with selectinload)
+    states: list["SubmissionStateLog"] = Relationship(
+        back_populates="submission",
+        sa_relationship_kwargs={
+            "order_by": "[SubmissionStateLog.timestamp, SubmissionStateLog.id]",
+            "lazy": "selectin",
+        },
+    )
 
-    changes: list["ChangeRequestLog"] = Relationship(back_populates="submission")
+    changes: list["ChangeRequestLog"] = Relationship(
+        back_populates="submission",
+        sa_relationship_kwargs={"order_by": "ChangeRequestLog.timestamp", "lazy": "raise"},
+    )
 
     def get_latest_state(self, filter_to_type: SubmissionStateEnum | None = None) -> Optional["SubmissionStateLog"]:
-        states = filter(lambda state: state.state == filter_to_type, self.states) if filter_to_type else self.states
-        states = sorted(states, key=attrgetter("timestamp"))
-        return states[-1] if states else None
+        """
+        Get the latest state from the loaded state history.
+
+        Requires the states relationship to be loaded, which orders it by timestamp.
+        To look up the latest state of a single submission, prefer `SubmissionDb.get_latest_state`.
+        """
+        states = reversed(self.states)
+        if filter_to_type:
+            return next((state for state in states if state.state == filter_to_type), None)
+        return next(states, None)
 
 
 class SubmissionStateLogBase(SQLModel):
@@ -160,8 +216,8 @@ class SubmissionStateLogBase(SQLModel):
 
     state: SubmissionStateEnum
     data: dict[str, Any] | None = Field(default=None, sa_column=Column(JSON))
-    timestamp: datetime.datetime = Field(
-        default_factory=lambda: datetime.datetime.now(datetime.UTC),
+    timestamp: IsoZDatetime = Field(
+        default_factory=utc_now,
         sa_column=Column(DateTime(timezone=True), nullable=False),
     )
 
@@ -169,10 +225,6 @@ class SubmissionStateLogBase(SQLModel):
         populate_by_name=True,
     )
 
-    @field_serializer("timestamp")
-    def serialize_timestamp(self, ts: datetime.datetime) -> str:
-        return serialize_datetime_to_iso_z(ts)
-
 
 class SubmissionStateLogPayload(SubmissionStateLogBase, BaseSignablePayload):
     """
@@ -187,7 +239,11 @@ class SubmissionStateLog(SubmissionStateLogBase, VerifiableLog[SubmissionStateLo
     """Submission state log table model."""
 
     __tablename__ = "submission_states"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        sa.Index("ix_submission_states_submission_timestamp", "submission_id", "timestamp"),
+        sa.Index("ix_submission_states_state_timestamp", "state", "timestamp", "submission_id"),
+        {"extend_existing": True},
+    )
 
     _payload_model_class: ClassVar = SubmissionStateLogPayload
 
@@ -197,7 +253,9 @@ class SubmissionStateLog(SubmissionStateLogBase, VerifiableLog[SubmissionStateLo
     author_name: str = Field(index=True)
     signature: str
 
-    submission: Submission | None = Relationship(back_populates="states")
+    # logs are loaded in bulk (e.g. the latest states across submissions), where loading the parent
+    # submission of each one would be an N+1 query, so it must be requested explicitly
+    submission: Submission | None = Relationship(back_populates="states", sa_relationship_kwargs={"lazy": "raise"})
 
 
 class SubmissionStateLogCreate(SubmissionStateLogBase):
@@ -231,8 +289,8 @@ class ChangeRequestLogBase(SQLModel):
 
     change: ChangeRequestEnum
     data: dict[str, Any] | None = Field(default=None, sa_column=Column(JSON))
-    timestamp: datetime.datetime = Field(
-        default_factory=lambda: datetime.datetime.now(datetime.UTC),
+    timestamp: IsoZDatetime = Field(
+        default_factory=utc_now,
         sa_column=Column(DateTime(timezone=True), nullable=False),
     )
 
@@ -240,10 +298,6 @@ class ChangeRequestLogBase(SQLModel):
         populate_by_name=True,
     )
 
-    @field_serializer("timestamp")
-    def serialize_timestamp(self, ts: datetime.datetime) -> str:
-        return serialize_datetime_to_iso_z(ts)
-
 
 class ChangeRequestLogPayload(ChangeRequestLogBase, BaseSignablePayload):
     """
@@ -268,7 +322,9 @@ class ChangeRequestLog(ChangeRequestLogBase, VerifiableLog[ChangeRequestLogPaylo
     author_name: str = Field(index=True)
     signature: str
 
-    submission: Submission | None = Relationship(back_populates="changes")
+    # logs are loaded in bulk (e.g. the latest states across submissions), where loading the parent
+    # submission of each one would be an N+1 query, so it must be requested explicitly
+    submission: Submission | None = Relationship(back_populates="changes", sa_relationship_kwargs={"lazy": "raise"})
 
 
 class ChangeRequestLogCreate(ChangeRequestLogBase):
@@ -293,13 +349,16 @@ class Donor(SQLModel, table=True):
     submission_id: str = Field(foreign_key="submissions.id", primary_key=True)
     pseudonym: str = Field(primary_key=True)
     relation: Relation
-    library_types: set[LibraryType] = Field(sa_column=Column(SemicolonSeparatedStringSet))
-    sequence_types: set[SequenceType] = Field(sa_column=Column(SemicolonSeparatedStringSet))
-    sequence_subtypes: set[SequenceSubtype] = Field(sa_column=Column(SemicolonSeparatedStringSet))
+    library_types: set[LibraryType] = Field(sa_column=Column(SemicolonSeparatedStringSet(element_enum=LibraryType)))
+    sequence_types: set[SequenceType] = Field(sa_column=Column(SemicolonSeparatedStringSet(element_enum=SequenceType)))
+    sequence_subtypes: set[SequenceSubtype] = Field(
+        sa_column=Column(SemicolonSeparatedStringSet(element_enum=SequenceSubtype))
+    )
     mv_consented: bool
     research_consented: bool | None = None
     research_consent_missing_justifications: set[ResearchConsentNoScopeJustification] | None = Field(
-        default=None, sa_column=Column(SemicolonSeparatedStringSet, nullable=True)
+        default=None,
+        sa_column=Column(SemicolonSeparatedStringSet(element_enum=ResearchConsentNoScopeJustification), nullable=True),
     )
 
     @field_validator("research_consent_missing_justifications")
@@ -313,16 +372,21 @@ class DetailedQCResult(SQLModel, table=True):
 
     __tablename__ = "detailed_qc_results"
     __table_args__ = (
+        sa.UniqueConstraint("submission_id", "lab_datum_id", "timestamp", name="uq_detailed_qc_results"),
         sa.ForeignKeyConstraint(["submission_id", "pseudonym"], ["donors.submission_id", "donors.pseudonym"]),
         {"extend_existing": True},
     )
 
-    submission_id: str = Field(primary_key=True)
-    lab_datum_id: str = Field(primary_key=True)
+    id: int | None = Field(
+        default=None,
+        sa_column=Column(sa.BigInteger().with_variant(sa.Integer(), "sqlite"), primary_key=True),
+    )
+    submission_id: str
+    lab_datum_id: str
     pseudonym: str
-    timestamp: datetime.datetime = Field(
-        default_factory=lambda: datetime.datetime.now(datetime.UTC),
-        sa_column=Column(DateTime(timezone=True), nullable=False, primary_key=True),
+    timestamp: IsoZDatetime = Field(
+        default_factory=utc_now,
+        sa_column=Column(DateTime(timezone=True), nullable=False),
     )
     sequence_type: SequenceType
     sequence_subtype: SequenceSubtype
@@ -343,9 +407,100 @@ class DetailedQCResult(SQLModel, table=True):
         populate_by_name=True,
     )
 
-    @field_serializer("timestamp")
-    def serialize_timestamp(self, ts: datetime.datetime) -> str:
-        return serialize_datetime_to_iso_z(ts)
+
+def _configure_sqlite_connection(dbapi_connection: Any, connection_record: Any) -> None:
+    """Use write-ahead logging so that commits don't rewrite the rollback journal every time."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    # durable at checkpoints rather than at every commit, which is safe in WAL mode
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+@functools.lru_cache(maxsize=8)
+def _create_engine(db_url: str, echo: bool) -> sa.Engine:
+    """
+    Create an engine tuned for the database backend.
+
+    Engines are shared by all SubmissionDb instances for the same URL, so that they also share pooled connections.
+    """
+    url = sa.make_url(db_url)
+    if url.get_backend_name() == "sqlite":
+        # an in-memory database only lives as long as its connection, so every checkout must get the same one
+        pool_options: dict[str, Any] = {"poolclass": sa.StaticPool} if url.database in (None, "", ":memory:") else {}
+        engine = create_engine(db_url, echo=echo, connect_args={"check_same_thread": False}, **pool_options)
+        sa.event.listen(engine, "connect", _configure_sqlite_connection)
+    else:
+        engine = create_engine(db_url, echo=echo, pool_pre_ping=True, pool_size=10, max_overflow=20)
+    return engine
+
+
+def _validate_submission_id(submission_id: str) -> str:
+    """Check just the pattern of a submission ID, raising the same ValidationError as constructing a Submission."""
+    try:
+        return Submission.validate_id_pattern(submission_id)
+    except ValueError as e:
+        raise pydantic_core.ValidationError.from_exception_data(
+            Submission.__name__,
+            [{"type": "value_error", "loc": ("id",), "input": submission_id, "ctx": {"error": e}}],
+        ) from None
+
+
+@functools.cache
+def _alembic_script_heads() -> frozenset[str]:
+    """Head revisions of the bundled migration scripts, which don't change at runtime and are shared by all databases."""
+    from alembic.config import Config as AlembicConfig
+    from alembic.script import ScriptDirectory as AlembicScriptDirectory
+
+    alembic_cfg = AlembicConfig()
+    alembic_cfg.set_main_option("script_location", "grz_db:migrations")
+    return frozenset(AlembicScriptDirectory.from_config(alembic_cfg).get_heads())
+
+
+def _select_submissions_by_latest_activity() -> SelectOfScalar[Submission]:
+    """Select submissions with their states, ordered by latest state timestamp or else submission date."""
+    latest_state_per_submission = (
+        select(
+            SubmissionStateLog.submission_id.label("submission_id"),  # type: ignore[attr-defined]
+            sqlfn.max(SubmissionStateLog.timestamp).label("timestamp"),
+        )
+        .group_by(SubmissionStateLog.submission_id)
+        .subquery("latest_state_per_submission")
+    )
+    return (
+        select(Submission)
+        .options(selectinload(Submission.states), raiseload("*"))  # type: ignore[arg-type]
+        .join(
+            latest_state_per_submission,
+            Submission.id == latest_state_per_submission.c.submission_id,  # type: ignore[arg-type]
+            isouter=True,
+        )
+        .order_by(
+            sqlfn.coalesce(latest_state_per_submission.c.timestamp, Submission.submission_date).desc().nulls_first()
+        )
+    )
+
+
+def _processed_between(start: datetime.date, end: datetime.date) -> SelectOfScalar[str]:
+    """IDs of submissions that were reported or finished detailed QC between the given dates, inclusive."""
+    return (
+        select(SubmissionStateLog.submission_id)
+        .where(SubmissionStateLog.state.in_([SubmissionStateEnum.REPORTED, SubmissionStateEnum.QCED]))  # type: ignore[attr-defined]
+        .where(SubmissionStateLog.timestamp.between(start, end))  # type: ignore[attr-defined]
+    )
+
+
+def _latest_state_id() -> sa.ScalarSelect[int]:
+    """Correlated subquery for the ID of the latest state of the enclosing query's submission."""
+    state = aliased(SubmissionStateLog)
+    return (
+        select(state.id)
+        .where(state.submission_id == Submission.id)
+        .order_by(state.timestamp.desc(), state.id.desc())  # type: ignore[attr-defined, union-attr]
+        .limit(1)
+        .correlate(Submission)
+        .scalar_subquery()
+    )
 
 
 class SubmissionDb:
@@ -361,36 +516,44 @@ class SubmissionDb:
             db_url: Database URL.
             debug: Whether to echo SQL statements.
         """
-        self.engine = create_engine(db_url, echo=debug)
+        self.engine = _create_engine(db_url, echo=debug)
         self._author = author
+        # only a successful check is remembered, an outdated schema is re-checked on every session
+        self._schema_checked = False
 
     @contextmanager
     def _get_session(self) -> Generator[Session, Any, None]:
         """Get an sqlmodel session."""
-        if not self._at_latest_schema():
-            raise OutdatedDatabaseSchemaError(
-                "Database not at latest schema. Please backup the database and then attempt a migration with `grzctl db upgrade`."
-            )
-        with Session(self.engine) as session:
+        if not self._schema_checked:
+            if not self._at_latest_schema():
+                raise OutdatedDatabaseSchemaError(
+                    "Database not at latest schema. Please backup the database and then attempt a migration with `grzctl db upgrade`."
+                )
+            self._schema_checked = True
+        # objects keep their values after commit, so written rows can be returned without being re-read
+        with Session(self.engine, expire_on_commit=False) as session:
             yield session
 
-    def _get_alembic_config(self) -> AlembicConfig:
+    def _get_alembic_config(self) -> "AlembicConfig":
         """
         Loads the alembic configuration.
 
         Args:
             alembic_ini_path: Path to alembic ini file.
         """
+        from alembic.config import Config as AlembicConfig
+
         alembic_cfg = AlembicConfig()
         alembic_cfg.set_main_option("script_location", "grz_db:migrations")
         alembic_cfg.set_main_option("sqlalchemy.url", str(self.engine.url))
         return alembic_cfg
 
     def _at_latest_schema(self) -> bool:
-        directory = AlembicScriptDirectory.from_config(self._get_alembic_config())
+        from alembic.runtime.migration import MigrationContext
+
         with self.engine.connect() as connection:
             context = MigrationContext.configure(connection)
-            return set(context.get_current_heads()) == set(directory.get_heads())
+            return set(context.get_current_heads()) == _alembic_script_heads()
 
     def initialize_schema(self):
         """Initialize the database."""
@@ -407,11 +570,24 @@ class SubmissionDb:
         Raises:
             RuntimeError: For underlying Alembic errors.
         """
+        from alembic import command as alembic_command
+
         alembic_cfg = self._get_alembic_config()
+        self._schema_checked = False
         try:
-            alembic_command.upgrade(alembic_cfg, revision)
+            # migrate through this engine's pool, which is the only way to reach an in-memory database
+            with self.engine.begin() as connection:
+                alembic_cfg.attributes["connection"] = connection
+                alembic_command.upgrade(alembic_cfg, revision)
         except Exception as e:
             raise RuntimeError(f"Alembic upgrade failed: {e}") from e
+        # upgrading to head leaves the schema current, so the next session need not check it again
+        self._schema_checked = revision == "head"
+
+    def _dialect_insert(self, model: type[SQLModel]) -> SqliteInsert | PostgresqlInsert:
+        """Return an INSERT for the table of the given model that supports the ON CONFLICT clauses of the engine's dialect."""
+        dialect_insert = postgresql_insert if self.engine.dialect.name == "postgresql" else sqlite_insert
+        return dialect_insert(model)
 
     def add_submission(
         self,
@@ -425,43 +601,97 @@ class SubmissionDb:
 
         Returns:
             An instance of Submission.
+
+        Raises:
+            pydantic.ValidationError: If the submission ID is malformed.
+            DuplicateSubmissionError: If the submission already exists.
         """
+        # the ID is the only input, so check just its pattern instead of validating a whole model
+        _validate_submission_id(submission_id)
+        # insert only if absent, so a duplicate is reported by the insert itself instead of a failed transaction;
+        # the row is returned as inserted, which also fills in its defaults without validating them again
+        statement = (
+            self._dialect_insert(Submission)
+            .values(id=submission_id)
+            .on_conflict_do_nothing(index_elements=["id"])
+            .returning(Submission)
+            # a new submission has no history yet, so its relationships are set empty instead of loaded
+            .options(noload("*"))
+        )
         with self._get_session() as session:
-            existing_submission = session.get(Submission, submission_id)
-            if existing_submission:
-                raise DuplicateSubmissionError(submission_id)
+            try:
+                db_submission = session.scalars(statement).one_or_none()
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+
+        if db_submission is None:
+            raise DuplicateSubmissionError(submission_id)
+        return db_submission
 
-            submission_create = SubmissionCreate(id=submission_id)
-            db_submission = Submission.model_validate(submission_create)
+    def add_submissions(self, submission_ids: Iterable[str], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Adds many submissions to the database in a single transaction.
+
+        Args:
+            submission_ids: Submission IDs.
+            batch_size: Maximum number of rows sent to the database per statement.
 
-            session.add(db_submission)
+        Returns:
+            The number of submissions added.
+
+        Raises:
+            pydantic.ValidationError: If any of the submission IDs is malformed. Nothing is added then.
+            DuplicateSubmissionError: If any of the submissions already exists. Nothing is added then.
+        """
+        seen_ids: set[str] = set()
+        with self._get_session() as session:
+            num_added = 0
             try:
+                for batch in itertools.batched(submission_ids, batch_size):
+                    for submission_id in batch:
+                        _validate_submission_id(submission_id)
+                        if submission_id in seen_ids:
+                            raise DuplicateSubmissionError(submission_id)
+                        seen_ids.add(submission_id)
+                    existing_ids = session.exec(select(Submission.id).where(Submission.id.in_(batch))).all()  # type: ignore[attr-defined]
+                    if existing_ids:
+                        raise DuplicateSubmissionError(min(existing_ids))
+                    num_added += insert_in_batches(
+                        session, Submission, [{"id": submission_id} for submission_id in batch], batch_size=batch_size
+                    )
                 session.commit()
-                session.refresh(db_submission)
-                return db_submission
-            except IntegrityError as e:
-                session.rollback()
-                raise e
             except Exception:
                 session.rollback()
                 raise
+        return num_added
 
     def modify_submission(self, submission_id: str, key: str, value: str) -> Submission:
-        if key not in SubmissionBase.model_fields:
+        if key not in _MUTABLE_SUBMISSION_FIELDS:
+            if key in SubmissionBase.immutable_fields:
+                raise ValueError(f"Column '{key}' is read-only and cannot be modified.")
             raise ValueError(f"Unknown column key '{key}'")
-        elif key in SubmissionBase.immutable_fields:
-            raise ValueError(f"Column '{key}' is read-only and cannot be modified.")
+
+        # validate before touching the database so that invalid values fail without a round-trip
+        validated = SubmissionBase.model_construct(id=submission_id)
+        SubmissionBase.__pydantic_validator__.validate_assignment(validated, key, value)
+        validated_value = getattr(validated, key)
 
         with self._get_session() as session:
-            submission = session.get(Submission, submission_id)
+            submission = session.get(Submission, submission_id, options=[raiseload("*")])
             if submission is None:
                 raise SubmissionNotFoundError(submission_id)
+            if getattr(submission, key) == validated_value:
+                # nothing to do
+                return submission
 
-            setattr(submission, key, value)
+            # already validated above, so set it through SQLAlchemy's instrumentation only,
+            # bypassing the second validation that assignment on the model would trigger
+            set_attribute(submission, key, validated_value)
             session.add(submission)
             try:
                 session.commit()
-                session.refresh(submission)
                 return submission
             except IntegrityError as e:
                 session.rollback()
@@ -489,37 +719,104 @@ class SubmissionDb:
         Returns:
             An instance of SubmissionStateLog.
         """
-        with self._get_session() as session:
-            submission = session.get(Submission, submission_id)
-            if not submission:
-                raise SubmissionNotFoundError(submission_id)
-            if not self._author:
-                raise ValueError("No author defined")
+        return self.update_submission_states([(submission_id, state, data)])[0]
 
-            state_log_payload = SubmissionStateLogPayload(
-                submission_id=submission_id, author_name=self._author.name, state=state, data=data
-            )
-            signature = state_log_payload.sign(self._author.private_key())
+    def update_submission_states(
+        self,
+        updates: Iterable[tuple[str, SubmissionStateEnum, dict | None]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[SubmissionStateLog]:
+        """
+        Updates the states of many submissions in a single transaction.
+
+        Args:
+            updates: Tuples of submission ID, new state, and optional data to attach to the update.
+            batch_size: Maximum number of rows sent to the database per statement.
 
-            state_log_create = SubmissionStateLogCreate(**state_log_payload.model_dump(), signature=signature.hex())
-            db_state_log = SubmissionStateLog.model_validate(state_log_create)
-            session.add(db_state_log)
+        Returns:
+            The created instances of SubmissionStateLog, in the order of the updates.
+        """
+        entries = (
+            {"submission_id": submission_id, "state": state, "data": data} for submission_id, state, data in updates
+        )
+        return self._add_signed_logs(SubmissionStateLog, entries, batch_size)
 
+    def _add_signed_logs[L: SubmissionStateLog | ChangeRequestLog](
+        self,
+        log_class: type[L],
+        entries: Iterable[dict[str, Any]],
+        batch_size: int,
+    ) -> list[L]:
+        """
+        Sign log entries as the author and insert them, one batch per statement, in a single transaction.
+
+        Existence of the referenced submissions is checked with one query per batch.
+        """
+        logs: list[L] = []
+        with self._get_session() as session:
             try:
+                for batch in itertools.batched(entries, batch_size):
+                    submission_ids = {entry["submission_id"] for entry in batch}
+                    existing_ids = set(session.exec(select(Submission.id).where(Submission.id.in_(submission_ids))))  # type: ignore[attr-defined]
+                    if missing_ids := submission_ids - existing_ids:
+                        raise SubmissionNotFoundError(min(missing_ids))
+                    if not self._author:
+                        raise ValueError("No author defined")
+
+                    private_key, public_key = self._author.private_key(), self._author.public_key()
+                    payloads = [
+                        log_class._payload_model_class(**entry, author_name=self._author.name) for entry in batch
+                    ]
+                    rows = [
+                        dict(payload, signature=payload.sign(private_key, public_key).hex()) for payload in payloads
+                    ]
+                    statement = sa.insert(log_class).returning(log_class, sort_by_parameter_order=True)
+                    logs.extend(session.scalars(statement, rows))
                 session.commit()
-                session.refresh(db_state_log)
-                return db_state_log
             except Exception:
                 session.rollback()
                 raise
+        return logs
 
-    def get_donors(self, submission_id: str, pseudonym: str | None = None) -> tuple[Donor, ...]:
-        """Retrieve all donors for a given submission, or, optionally, only for a specific pseudonym."""
+    def get_latest_state(
+        self, submission_id: str, filter_to_type: SubmissionStateEnum | None = None
+    ) -> SubmissionStateLog | None:
+        """
+        Retrieves the latest state of a submission without loading its state history.
+
+        Args:
+            submission_id: Submission ID of the submission.
+            filter_to_type: Optionally, only consider states of this type.
+
+        Returns:
+            The latest instance of SubmissionStateLog or None if the submission has no (matching) states.
+        """
+        with self._get_session() as session:
+            statement = lambda_stmt(
+                lambda: select(SubmissionStateLog)
+                .where(SubmissionStateLog.submission_id == submission_id)
+                # same tie-break on identical timestamps as list_submissions_with_latest_state
+                .order_by(SubmissionStateLog.timestamp.desc(), SubmissionStateLog.id.desc())  # type: ignore[attr-defined, union-attr]
+                .limit(1)
+            )
+            if filter_to_type is not None:
+                statement += lambda s: s.where(SubmissionStateLog.state == filter_to_type)
+            return session.scalars(statement).first()
+
+    def get_donors(self, submission_id: str, pseudonym: str | Iterable[str] | None = None) -> tuple[Donor, ...]:
+        """
+        Retrieve all donors for a given submission, or, optionally, only for a specific pseudonym.
+
+        Several pseudonyms can be given at once to look them up in a single query.
+        """
         with self._get_session() as session:
-            statement = select(Donor).where(Donor.submission_id == submission_id)
-            if pseudonym is not None:
-                statement = statement.where(Donor.pseudonym == pseudonym)
-            donors = tuple(session.exec(statement).all())
+            statement = lambda_stmt(lambda: select(Donor).where(Donor.submission_id == submission_id))
+            if isinstance(pseudonym, str):
+                statement += lambda s: s.where(Donor.pseudonym == pseudonym)
+            elif pseudonym is not None:
+                pseudonyms = tuple(pseudonym)
+                statement += lambda s: s.where(Donor.pseudonym.in_(pseudonyms))  # type: ignore[attr-defined]
+            donors = tuple(session.scalars(statement).all())
         return donors
 
     def add_donor(self, donor: Donor) -> Donor:
@@ -529,7 +826,6 @@ class SubmissionDb:
 
             try:
                 session.commit()
-                session.refresh(donor)
                 return donor
             except Exception as e:
                 session.rollback()
@@ -537,36 +833,81 @@ class SubmissionDb:
 
     def update_donor(self, updated_donor: Donor) -> Donor:
         """Update a donor in the database."""
+        # a single UPDATE ... RETURNING instead of loading the donor and diffing it field by field
+        values = column_values(updated_donor)
+        statement = (
+            sa.update(Donor)
+            .where(Donor.submission_id == values.pop("submission_id"))  # type: ignore[arg-type]
+            .where(Donor.pseudonym == values.pop("pseudonym"))  # type: ignore[arg-type]
+            .values(**values)
+            .returning(Donor)
+        )
         with self._get_session() as session:
-            statement = (
-                select(Donor)
-                .where(Donor.submission_id == updated_donor.submission_id)
-                .where(Donor.pseudonym == updated_donor.pseudonym)
-            )
-            db_donor = session.exec(statement).first()
+            try:
+                db_donor = session.scalars(statement).one_or_none()
+                if db_donor is None:
+                    raise RuntimeError("Cannot update a donor that doesn't yet exist in the database.")
+                session.commit()
+                return db_donor
+            except Exception as e:
+                session.rollback()
+                raise e
 
-            if db_donor is None:
-                raise RuntimeError("Cannot update a donor that doesn't yet exist in the database.")
+    def update_donors(self, updated_donors: Iterable[Donor], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Update many donors in the database in a single transaction.
 
-            if db_donor == updated_donor:
-                # nothing to do
-                return db_donor
+        Args:
+            updated_donors: Donors to update, matched on submission ID and pseudonym.
+            batch_size: Maximum number of rows sent to the database per statement.
 
-            for field in db_donor.model_fields:
-                old_value = getattr(db_donor, field)
-                new_value = getattr(updated_donor, field)
-                if old_value != new_value:
-                    setattr(db_donor, field, new_value)
+        Returns:
+            The number of donors updated.
 
-            session.add(db_donor)
+        Raises:
+            RuntimeError: If any of the donors doesn't yet exist in the database. Nothing is updated then.
+        """
+        donor_key = sa.tuple_(Donor.submission_id, Donor.pseudonym)  # type: ignore[arg-type]
+        with self._get_session() as session:
+            num_updated = 0
+            try:
+                for batch in itertools.batched(map(column_values, updated_donors), batch_size):
+                    keys = {(row["submission_id"], row["pseudonym"]) for row in batch}
+                    existing_keys = set(
+                        session.execute(
+                            sa.select(Donor.submission_id, Donor.pseudonym).where(donor_key.in_(keys))  # type: ignore[call-overload]
+                        ).tuples()
+                    )
+                    if keys - existing_keys:
+                        raise RuntimeError("Cannot update a donor that doesn't yet exist in the database.")
+                    # ORM bulk UPDATE by primary key, one executemany per batch
+                    session.execute(sa.update(Donor), list(batch))
+                    num_updated += len(batch)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+        return num_updated
+
+    def add_donors(self, donors: Iterable[Donor], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Add many donors to the database in a single transaction.
+
+        Args:
+            donors: Donors to add.
+            batch_size: Maximum number of rows sent to the database per statement.
 
+        Returns:
+            The number of donors added.
+        """
+        with self._get_session() as session:
             try:
+                num_added = insert_in_batches(session, Donor, map(column_values, donors), batch_size=batch_size)
                 session.commit()
-                session.refresh(db_donor)
-                return db_donor
-            except Exception as e:
+            except Exception:
                 session.rollback()
-                raise e
+                raise
+        return num_added
 
     def delete_donor(self, donor: Donor) -> None:
         """Delete a donor from the database."""
@@ -582,10 +923,22 @@ class SubmissionDb:
     def get_detailed_qc_results(self, submission_id: str) -> tuple[DetailedQCResult, ...]:
         """Retrieve all detailed QC results for a given submission."""
         with self._get_session() as session:
-            statement = select(DetailedQCResult).where(DetailedQCResult.submission_id == submission_id)
-            results = tuple(session.exec(statement).all())
+            statement = lambda_stmt(
+                lambda: select(DetailedQCResult).where(DetailedQCResult.submission_id == submission_id)
+            )
+            results = tuple(session.scalars(statement).all())
         return results
 
+    def iter_detailed_qc_results(self, submission_id: str, batch_size: int = 500) -> Iterator[DetailedQCResult]:
+        """
+        Like `get_detailed_qc_results`, but streams the results instead of loading all of them at once.
+
+        The database session stays open until the iterator is exhausted or closed.
+        """
+        with self._get_session() as session:
+            statement = select(DetailedQCResult).where(DetailedQCResult.submission_id == submission_id)
+            yield from session.scalars(statement, execution_options={"yield_per": batch_size})
+
     def add_detailed_qc_result(self, result: DetailedQCResult) -> DetailedQCResult:
         """Add or update a detailed QC result to/in the database."""
         with self._get_session() as session:
@@ -593,12 +946,66 @@ class SubmissionDb:
 
             try:
                 session.commit()
-                session.refresh(result)
                 return result
             except Exception as e:
                 session.rollback()
                 raise e
 
+    def add_detailed_qc_results(self, results: Iterable[DetailedQCResult], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Add many detailed QC results to the database in a single transaction.
+
+        Args:
+            results: Detailed QC results to add.
+            batch_size: Maximum number of rows sent to the database per statement.
+
+        Returns:
+            The number of results added.
+        """
+        with self._get_session() as session:
+            try:
+                num_added = insert_in_batches(
+                    session, DetailedQCResult, map(column_values, results), batch_size=batch_size
+                )
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+        return num_added
+
+    def bulk_load(
+        self,
+        submissions: Iterable[Submission] = (),
+        donors: Iterable[Donor] = (),
+        detailed_qc_results: Iterable[DetailedQCResult] = (),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """
+        Insert many submissions, donors, and detailed QC results in a single transaction.
+
+        Tables are written in foreign key order (submissions, then donors, then
+        detailed QC results) using batched executemany inserts instead of one
+        round-trip per object.
+
+        Args:
+            submissions: Submissions to insert.
+            donors: Donors to insert.
+            detailed_qc_results: Detailed QC results to insert.
+            batch_size: Maximum number of rows sent to the database per statement.
+        """
+        with self._get_session() as session:
+            try:
+                for model, objects in (
+                    (Submission, submissions),
+                    (Donor, donors),
+                    (DetailedQCResult, detailed_qc_results),
+                ):
+                    insert_in_batches(session, model, map(column_values, objects), batch_size=batch_size)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+
     def add_change_request(
         self,
         submission_id: str,
@@ -616,31 +1023,34 @@ class SubmissionDb:
         Returns:
             An instance of ChangeRequestLog.
         """
-        with self._get_session() as session:
-            submission = session.get(Submission, submission_id)
-            if not submission:
-                raise SubmissionNotFoundError(submission_id)
-            if not self._author:
-                raise ValueError("No author defined")
+        return self.add_change_requests([(submission_id, change, data)])[0]
 
-            change_request_log_payload = ChangeRequestLogPayload(
-                submission_id=submission_id, author_name=self._author.name, change=change, data=data
-            )
-            signature = change_request_log_payload.sign(self._author.private_key())
+    def add_change_requests(
+        self,
+        change_requests: Iterable[tuple[str, ChangeRequestEnum, dict | None]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[ChangeRequestLog]:
+        """
+        Register many change requests in a single transaction.
 
-            change_request_log_create = ChangeRequestLogCreate(
-                **change_request_log_payload.model_dump(), signature=signature.hex()
-            )
-            db_change_request_log = ChangeRequestLog.model_validate(change_request_log_create)
-            session.add(db_change_request_log)
+        Args:
+            change_requests: Tuples of submission ID, requested change, and optional data to attach to the request.
+            batch_size: Maximum number of rows sent to the database per statement.
 
-            try:
-                session.commit()
-                session.refresh(db_change_request_log)
-                return db_change_request_log
-            except Exception:
-                session.rollback()
-                raise
+        Returns:
+            The created instances of ChangeRequestLog, in the order of the change requests.
+        """
+        entries = (
+            {"submission_id": submission_id, "change": change, "data": data}
+            for submission_id, change, data in change_requests
+        )
+        return self._add_signed_logs(ChangeRequestLog, entries, batch_size)
+
+    def submission_exists(self, submission_id: str) -> bool:
+        """Check whether a submission exists without loading it."""
+        with self._get_session() as session:
+            statement = lambda_stmt(lambda: select(sa.exists().where(Submission.id == submission_id)))  # type: ignore[arg-type]
+            return bool(session.scalar(statement))
 
     def get_submission(self, submission_id: str) -> Submission | None:
         """
@@ -653,11 +1063,21 @@ class SubmissionDb:
             An instance of Submission or None.
         """
         with self._get_session() as session:
-            statement = (
-                select(Submission).where(Submission.id == submission_id).options(selectinload(Submission.states))  # type: ignore[arg-type]
+            # lambda statements are built and compiled once, later calls only bind the new ID;
+            # for a single submission, joining its states in costs one round-trip instead of two
+            statement = lambda_stmt(
+                lambda: select(Submission)
+                .where(Submission.id == submission_id)
+                .options(joinedload(Submission.states), raiseload("*"))  # type: ignore[arg-type]
             )
-            submission = session.exec(statement).first()
-            return submission
+            return session.scalars(statement).unique().first()
+
+    @staticmethod
+    def _list_submissions_statement(limit: int | None) -> StatementLambdaElement:
+        statement = lambda_stmt(_select_submissions_by_latest_activity)
+        if limit is not None:
+            statement += lambda s: s.limit(limit)
+        return statement
 
     def list_submissions(self, limit: int | None) -> Sequence[Submission]:
         """
@@ -669,32 +1089,66 @@ class SubmissionDb:
             date, with submissions missing both of these sorting first.
         """
         with self._get_session() as session:
-            latest_state_per_submission = (
-                select(
-                    SubmissionStateLog.submission_id.label("submission_id"),  # type: ignore[attr-defined]
-                    sqlfn.max(SubmissionStateLog.timestamp).label("timestamp"),
-                )
-                .group_by(SubmissionStateLog.submission_id)
-                .subquery("latest_state_per_submission")
-            )
+            submissions = session.scalars(self._list_submissions_statement(limit)).all()
+            return submissions
+
+    def iter_submissions(self, limit: int | None = None, batch_size: int = 500) -> Iterator[Submission]:
+        """
+        Like `list_submissions`, but streams the submissions instead of loading all of them at once.
+
+        Submissions and their states are fetched `batch_size` submissions at a time,
+        so memory use does not grow with the size of the table.
+        The database session stays open until the iterator is exhausted or closed.
+        """
+        with self._get_session() as session:
+            statement = self._list_submissions_statement(limit)
+            yield from session.scalars(statement, execution_options={"yield_per": batch_size})
+
+    def list_submissions_with_latest_state(
+        self, limit: int | None
+    ) -> Sequence[tuple[Submission, SubmissionStateLog | None]]:
+        """
+        Lists all submissions in the database together with only their latest state.
+
+        Unlike `list_submissions`, the state history is not loaded, so the
+        cost per submission does not grow with the number of states.
+
+        Returns:
+            A list of (submission, latest state) pairs, with the latest state
+            being None for submissions without states. Ordered like `list_submissions`.
+        """
+        with self._get_session() as session:
             statement = (
-                select(Submission)
-                .options(selectinload(Submission.states))  # type: ignore[arg-type]
-                .join(
-                    latest_state_per_submission,
-                    Submission.id == latest_state_per_submission.c.submission_id,  # type: ignore[arg-type]
-                    isouter=True,
-                )
-                .order_by(
-                    sqlfn.coalesce(latest_state_per_submission.c.timestamp, Submission.submission_date)
-                    .desc()
-                    .nulls_first()
-                )
+                select(Submission, SubmissionStateLog)
+                .options(raiseload("*"))
+                .join(SubmissionStateLog, SubmissionStateLog.id == _latest_state_id(), isouter=True)  # type: ignore[arg-type]
+                .order_by(sqlfn.coalesce(SubmissionStateLog.timestamp, Submission.submission_date).desc().nulls_first())
             )
             if limit is not None:
                 statement = statement.limit(limit)
-            submissions = session.exec(statement).all()
-            return submissions
+            return session.exec(statement).all()
+
+    def get_latest_states(self, submission_ids: Iterable[str]) -> dict[str, SubmissionStateLog | None]:
+        """
+        Retrieves the latest state of many submissions at once, without loading their state histories.
+
+        Args:
+            submission_ids: Submission IDs of the submissions.
+
+        Returns:
+            A mapping from submission ID to its latest instance of SubmissionStateLog,
+            or None if the submission has no states. Submissions missing from the database are left out.
+        """
+        latest_states: dict[str, SubmissionStateLog | None] = {}
+        with self._get_session() as session:
+            for batch in itertools.batched(submission_ids, DEFAULT_BATCH_SIZE):
+                statement = (
+                    select(Submission.id, SubmissionStateLog)
+                    .join(SubmissionStateLog, SubmissionStateLog.id == _latest_state_id(), isouter=True)  # type: ignore[arg-type]
+                    .where(Submission.id.in_(batch))  # type: ignore[attr-defined]
+                )
+                latest_states.update(session.exec(statement).all())
+        return latest_states
 
     def list_processed_between(self, start: datetime.date, end: datetime.date) -> Sequence[Submission]:
         """
@@ -702,21 +1156,40 @@ class SubmissionDb:
         Processed is defined as either reported (Prüfbericht submitted) or detailed QC finished.
         """
         with self._get_session() as session:
-            reported_within_window = (
-                select(SubmissionStateLog.submission_id)
-                .where(SubmissionStateLog.state.in_([SubmissionStateEnum.REPORTED, SubmissionStateEnum.QCED]))  # type: ignore[attr-defined]
-                .where(SubmissionStateLog.timestamp.between(start, end))  # type: ignore[attr-defined]
-                .subquery()
-            )
+            # a semi-join yields each submission once, so no DISTINCT over the submission rows is needed
             statement = (
                 select(Submission)
-                .options(selectinload(Submission.states))  # type: ignore[arg-type]
-                .join(reported_within_window, Submission.id == reported_within_window.c.submission_id)  # type: ignore[arg-type]
-                .distinct()
+                .options(selectinload(Submission.states), raiseload("*"))  # type: ignore[arg-type]
+                .where(Submission.id.in_(_processed_between(start, end)))  # type: ignore[attr-defined]
             )
             submissions = session.exec(statement).all()
             return submissions
 
+    def list_reported_processed_between(
+        self, start: datetime.date, end: datetime.date
+    ) -> Sequence[sa.Row[tuple[str, bool | None, bool | None, datetime.datetime]]]:
+        """
+        Lists the submissions processed between the given start and end dates, inclusive, that have been reported.
+
+        Only the columns needed for reporting are selected and no state logs are loaded.
+
+        Returns:
+            Rows of (id, basic_qc_passed, detailed_qc_passed, last_reported), ordered by submission ID,
+            where last_reported is the timestamp of the latest reported state.
+        """
+        last_reported = sqlfn.max(SubmissionStateLog.timestamp).label("last_reported")
+        statement = (
+            sa.select(Submission.id, Submission.basic_qc_passed, Submission.detailed_qc_passed, last_reported)  # type: ignore[call-overload]
+            .join(SubmissionStateLog, SubmissionStateLog.submission_id == Submission.id)  # type: ignore[arg-type]
+            .where(SubmissionStateLog.state == SubmissionStateEnum.REPORTED)  # type: ignore[arg-type]
+            .where(Submission.id.in_(_processed_between(start, end)))  # type: ignore[attr-defined]
+            # the other submission columns are functionally dependent on its primary key
+            .group_by(Submission.id)
+            .order_by(Submission.id)
+        )
+        with self._get_session() as session:
+            return session.execute(statement).all()  # type: ignore[return-value]
+
     def list_change_requests(self) -> Sequence[Submission]:
         """
         Lists all submissions in the database.
@@ -725,11 +1198,11 @@ class SubmissionDb:
             A list of all submissions in the database, ordered by their ID.
         """
         with self._get_session() as session:
-            statement = (
-                select(Submission)
+            statement = lambda_stmt(
+                lambda: select(Submission)
                 .where(Submission.changes.any())  # type: ignore[attr-defined]
-                .options(selectinload(Submission.changes))  # type: ignore[arg-type]
+                .options(selectinload(Submission.changes), raiseload("*"))  # type: ignore[arg-type]
                 .order_by(Submission.id)
             )
-            change_requests = session.exec(statement).all()
+            change_requests = session.scalars(statement).all()
             return change_requests
@@ -75,6 +75,10 @@ EXPECTED_CATEGORIES = {
         ]
     ),
 }
+# (system, code) of each expected category, so categories can be matched without building CodeableConcepts
+_EXPECTED_CATEGORY_NAMES_BY_KEY = {
+    (category.coding[0].system, category.coding[0].code): name for name, category in EXPECTED_CATEGORIES.items()
+}
 
 
 class Consent(StrictIgnoringBaseModel):
@@ -111,14 +115,13 @@ class Consent(StrictIgnoringBaseModel):
                 raise ValueError(
                     f"consent.category[{i}].coding must contain only a single element, not {len(category.coding)}"
                 )
-            category_minimal = CodeableConcept(
-                coding=[Coding(system=category.coding[0].system, code=category.coding[0].code)]
+            expected_category_name = _EXPECTED_CATEGORY_NAMES_BY_KEY.get(
+                (category.coding[0].system, category.coding[0].code)
             )
-            for expected_category_name, expected_category in EXPECTED_CATEGORIES.items():
-                if expected_category == category_minimal:
-                    if expected_category_name not in categories_to_find:
-                        raise ValueError(f"Duplicate required category in consent.category: {category}")
-                    categories_to_find.remove(expected_category_name)
+            if expected_category_name is not None:
+                if expected_category_name not in categories_to_find:
+                    raise ValueError(f"Duplicate required category in consent.category: {category}")
+                categories_to_find.remove(expected_category_name)
 
         if categories_to_find:
             raise ValueError(f"Missing expected categories: {[EXPECTED_CATEGORIES[c] for c in categories_to_find]}")
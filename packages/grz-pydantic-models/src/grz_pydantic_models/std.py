@@ -4,12 +4,16 @@ from warnings import warn
 
 def deprecated(func=None, /, msg=None):
     def decorator(f):
+        message = f"{f.__name__} is deprecated." if msg is None else msg
+        warned = False
+
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
-            if msg is None:
-                warn(f"{f.__name__} is deprecated.")
-            else:
-                warn(msg)
+            # warn on the first call only, warn() is too costly to repeat for helpers called in loops
+            nonlocal warned
+            if not warned:
+                warned = True
+                warn(message, stacklevel=2)
             return f(*args, **kwargs)
 
         return wrapper
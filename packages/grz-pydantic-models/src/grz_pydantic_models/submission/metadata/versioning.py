@@ -5,7 +5,6 @@ Handles aspects related to submission metadata schema versioning, such as compar
 """
 
 from functools import total_ordering
-from itertools import zip_longest
 from typing import Any
 
 
@@ -17,23 +16,30 @@ class Version:
     Currently, they can only be simple versions like 1, 1.2, 1.2.1, etc.
     """
 
+    __slots__ = ("_components",)
+
     def __init__(self, version: str):
         try:
-            self._components = map(int, version.split("."))
+            components = [int(component) for component in version.split(".")]
         except Exception as err:
             raise ValueError(f"Failed to parse '{version}' as a version string") from err
+        # trailing zeros don't change a version (1 == 1.0), so drop them to make equal versions equal tuples
+        while len(components) > 1 and components[-1] == 0:
+            components.pop()
+        self._components: tuple[int, ...] = tuple(components)
 
     def __eq__(self, other: Any) -> bool:
         """Equal to"""
         if not isinstance(other, Version):
             return False
-        return all((a == b) for a, b in zip_longest(self._components, other._components, fillvalue=0))
+        return self._components == other._components
 
     def __lt__(self, other: Any) -> bool:
         """Less than"""
         if not isinstance(other, Version):
             raise TypeError(f"Version can only be compared to another Version, not {type(other)}")
-        for a, b in zip_longest(self._components, other._components, fillvalue=0):
-            if a != b:
-                return a < b
-        return False
+        return self._components < other._components
+
+    def __hash__(self) -> int:
+        """Hash, consistent with equality"""
+        return hash(self._components)
@@ -1,4 +1,5 @@
 import copy
+import functools
 import importlib.resources
 import itertools
 import json
@@ -13,17 +14,29 @@ from pydantic import ValidationError
 
 from . import resources
 
+resource_files = importlib.resources.files(resources)
+
 TESTED_VERSIONS = ["1.2.1", "1.3.0"]
 
 
+@functools.cache
+def _read_resource(*path: str) -> str:
+    """Read a test resource once per session; tests that modify it parse their own copy with json.loads."""
+    return resource_files.joinpath(*path).read_text()
+
+
+@functools.cache
+def _load_consent(case: str) -> Consent:
+    """Parse an example research consent once per session; consents_to_research only reads it."""
+    return Consent.model_validate_json(_read_resource("example_research_consent", f"{case}.json"))
+
+
 @pytest.mark.parametrize(
     "dataset,version",
     itertools.product(["panel", "wes_tumor_germline", "wgs_tumor_germline", "wgs_lr", "wgs_trio"], TESTED_VERSIONS),
 )
 def test_examples(dataset: str, version: str):
-    metadata_str = (
-        importlib.resources.files(resources).joinpath("example_metadata", dataset, f"v{version}.json").read_text()
-    )
+    metadata_str = _read_resource("example_metadata", dataset, f"v{version}.json")
     GrzSubmissionMetadata.model_validate_json(metadata_str)
 
 
@@ -31,11 +44,7 @@ def test_wgs_trio_special_consent():
     """
     Broad Consent obtained before 2025-06-15 for non-index donors is allowed to stand in for mvConsent if missing
     """
-    metadata_str = (
-        importlib.resources.files(resources)
-        .joinpath("example_metadata", "wgs_trio", "v1.1.7.earlyBCException.json")
-        .read_text()
-    )
+    metadata_str = _read_resource("example_metadata", "wgs_trio", "v1.1.7.earlyBCException.json")
     GrzSubmissionMetadata.model_validate_json(metadata_str)
 
     # only non-index donors can have the special researchConsent exemption
@@ -46,7 +55,7 @@ def test_wgs_trio_special_consent():
     with pytest.raises(
         ValidationError, match=r"All donors must consent to model project participation for initial submissions."
     ):
-        GrzSubmissionMetadata.model_validate_json(json.dumps(metadata))
+        GrzSubmissionMetadata.model_validate(metadata)
 
 
 @pytest.mark.parametrize(
@@ -57,16 +66,14 @@ def test_wgs_trio_no_vcf(version):
     """
     VCFs were downgraded from required to recommended for all submissions.
     """
-    metadata_str = (
-        importlib.resources.files(resources).joinpath("example_metadata", "wgs_trio", f"v{version}.json").read_text()
-    )
+    metadata_str = _read_resource("example_metadata", "wgs_trio", f"v{version}.json")
     GrzSubmissionMetadata.model_validate_json(metadata_str)
 
     metadata = json.loads(metadata_str)
     # delete the VCF file for the index donor
     del metadata["donors"][0]["labData"][0]["sequenceData"]["files"][2]
 
-    GrzSubmissionMetadata.model_validate_json(json.dumps(metadata))
+    GrzSubmissionMetadata.model_validate(metadata)
 
 
 @pytest.mark.parametrize(
@@ -75,13 +82,11 @@ def test_wgs_trio_no_vcf(version):
 )
 def test_wgs_trio_1_3_fail_empty_consent_list(version: str):
     """As of v1.3, empty consent lists are no longer allowed."""
-    metadata_str = (
-        importlib.resources.files(resources).joinpath("example_metadata", "wgs_trio", f"v{version}.json").read_text()
-    )
+    metadata_str = _read_resource("example_metadata", "wgs_trio", f"v{version}.json")
     metadata = json.loads(metadata_str)
     metadata["donors"][0]["researchConsents"] = []
-    with pytest.raises(ValidationError):
-        GrzSubmissionMetadata.model_validate_json(metadata)
+    with pytest.raises(ValidationError, match=r"Donors must have research consent as of metadata schema v1.3"):
+        GrzSubmissionMetadata.model_validate(metadata)
 
 
 @pytest.mark.parametrize(
@@ -90,37 +95,35 @@ def test_wgs_trio_1_3_fail_empty_consent_list(version: str):
 )
 def test_wgs_trio_1_3_fail_malformed_consent(version: str):
     """As of v1.3, non-empty scope or noScopeJustification must be provided."""
-    metadata_str = (
-        importlib.resources.files(resources).joinpath("example_metadata", "wgs_trio", f"v{version}.json").read_text()
-    )
+    metadata_str = _read_resource("example_metadata", "wgs_trio", f"v{version}.json")
     metadata = json.loads(metadata_str)
 
     # scope, if provided, must be a valid consent object
     del metadata["donors"][0]["researchConsents"][0]["scope"]["scope"]
     with pytest.raises(ValidationError, match=r"scope must be a valid MII Broad Consent as of metadata v1.3"):
-        GrzSubmissionMetadata.model_validate_json(json.dumps(metadata))
+        GrzSubmissionMetadata.model_validate(metadata)
 
     # scope can't be an empty dict
     metadata["donors"][0]["researchConsents"][0]["scope"] = {}
     with pytest.raises(ValidationError):
-        GrzSubmissionMetadata.model_validate_json(json.dumps(metadata))
+        GrzSubmissionMetadata.model_validate(metadata)
 
     metadata["donors"][0]["researchConsents"][0]["noScopeJustification"] = "patient unable to consent"
     # scope, even if an empty dict, can't be provided along with noScopeJustification
     with pytest.raises(ValidationError):
-        GrzSubmissionMetadata.model_validate_json(json.dumps(metadata))
+        GrzSubmissionMetadata.model_validate(metadata)
 
     del metadata["donors"][0]["researchConsents"][0]["scope"]
-    GrzSubmissionMetadata.model_validate_json(json.dumps(metadata))
+    GrzSubmissionMetadata.model_validate(metadata)
 
     # schemaVersion can be missing now
     del metadata["donors"][0]["researchConsents"][0]["schemaVersion"]
-    GrzSubmissionMetadata.model_validate_json(json.dumps(metadata))
+    GrzSubmissionMetadata.model_validate(metadata)
 
     # but presentationDate no longer can
     del metadata["donors"][0]["researchConsents"][0]["presentationDate"]
     with pytest.raises(ValidationError):
-        GrzSubmissionMetadata.model_validate_json(json.dumps(metadata))
+        GrzSubmissionMetadata.model_validate(metadata)
 
 
 @pytest.mark.parametrize(
@@ -129,9 +132,7 @@ def test_wgs_trio_1_3_fail_malformed_consent(version: str):
 )
 def test_invalid_short_read_submission_with_bam(dataset: str, version: str):
     """BAM files should only be allowed in *_lr lab data"""
-    metadata = json.loads(
-        importlib.resources.files(resources).joinpath("example_metadata", dataset, f"v{version}.json").read_text()
-    )
+    metadata = json.loads(_read_resource("example_metadata", dataset, f"v{version}.json"))
     # add a BAM file
     metadata["donors"][0]["labData"][0]["sequenceData"]["files"].append(
         {
@@ -145,17 +146,13 @@ def test_invalid_short_read_submission_with_bam(dataset: str, version: str):
     )
 
     with pytest.raises(ValidationError):
-        GrzSubmissionMetadata.model_validate_json(json.dumps(metadata))
+        GrzSubmissionMetadata.model_validate(metadata)
 
 
 @pytest.mark.parametrize("version", TESTED_VERSIONS)
 def test_index_rna_without_dna(version: str):
     """Donors can only have RNA data if DNA data also present."""
-    metadata = json.loads(
-        importlib.resources.files(resources)
-        .joinpath("example_metadata", "wes_tumor_germline", f"v{version}.json")
-        .read_text()
-    )
+    metadata = json.loads(_read_resource("example_metadata", "wes_tumor_germline", f"v{version}.json"))
     # reduce to a single lab datum
     metadata["donors"][0]["labData"] = [metadata["donors"][0]["labData"][0]]
     # set the library type to RNA
@@ -165,33 +162,31 @@ def test_index_rna_without_dna(version: str):
     with pytest.raises(
         ValidationError, match="Index donor must have at least one lab datum with one of the following library types"
     ):
-        GrzSubmissionMetadata.model_validate_json(json.dumps(metadata))
+        GrzSubmissionMetadata.model_validate(metadata)
 
 
 @pytest.mark.parametrize("version", TESTED_VERSIONS)
 def test_index_rna_with_dna(version: str):
     """Donors can only have RNA data if DNA data also present."""
-    metadata = json.loads(
-        importlib.resources.files(resources)
-        .joinpath("example_metadata", "wes_tumor_germline", f"v{version}.json")
-        .read_text()
+    metadata = json.loads(_read_resource("example_metadata", "wes_tumor_germline", f"v{version}.json"))
+    # duplicate the last lab datum as RNA; only top-level fields change, so a shallow copy suffices
+    last_lab_datum = metadata["donors"][0]["labData"][-1]
+    metadata["donors"][0]["labData"].append(
+        {
+            **last_lab_datum,
+            "libraryType": "wxs",
+            "sequenceType": "rna",
+            "labDataName": last_lab_datum["labDataName"] + " RNA",
+        }
     )
-    # duplicate the last lab datum
-    metadata["donors"][0]["labData"].append(copy.deepcopy(metadata["donors"][0]["labData"][-1]))
-    # set the library type to RNA
-    metadata["donors"][0]["labData"][-1]["libraryType"] = "wxs"
-    metadata["donors"][0]["labData"][-1]["sequenceType"] = "rna"
-    metadata["donors"][0]["labData"][-1]["labDataName"] = metadata["donors"][0]["labData"][-2]["labDataName"] + " RNA"
 
-    GrzSubmissionMetadata.model_validate_json(json.dumps(metadata))
+    GrzSubmissionMetadata.model_validate(metadata)
 
 
 @pytest.mark.parametrize("version", TESTED_VERSIONS)
 def test_lab_datum(version: str):
     metadata = GrzSubmissionMetadata.model_validate_json(
-        importlib.resources.files(resources)
-        .joinpath("example_metadata", "wes_tumor_germline", f"v{version}.json")
-        .read_text()
+        _read_resource("example_metadata", "wes_tumor_germline", f"v{version}.json")
     )
     with pytest.raises(ValueError, match="Long read libraries can't be paired-end."):
         metadata.donors[0].lab_data[0].library_type = "wes_lr"
@@ -231,9 +226,7 @@ def test_research_consent_parse(case: str, valid: bool):
     expectation = nullcontext() if valid else pytest.raises(ValidationError)
 
     with expectation:
-        Consent.model_validate_json(
-            importlib.resources.files(resources).joinpath("example_research_consent", f"{case}.json").read_text()
-        )
+        Consent.model_validate_json(_read_resource("example_research_consent", f"{case}.json"))
 
 
 @pytest.mark.parametrize(
@@ -252,28 +245,21 @@ def test_research_consent_parse(case: str, valid: bool):
 def test_multi_research_consent(cases: list[str], consenting: bool):
     consents = []
     for case in cases:
-        consent = Consent.model_validate_json(
-            importlib.resources.files(resources).joinpath("example_research_consent", f"{case}.json").read_text()
-        )
-        consents.append(ResearchConsent(schemaVersion="2025.0.1", scope=consent))
+        consents.append(ResearchConsent(schemaVersion="2025.0.1", scope=_load_consent(case)))
 
     assert ResearchConsent.consents_to_research(consents, date=date(year=2025, month=6, day=25)) == consenting
 
 
 def test_research_consent_subprovisions_deny_permit():
     """Within one research consent's subprovisions, deny before permit should return a non-consented state."""
-    consent_raw = json.loads(
-        importlib.resources.files(resources)
-        .joinpath("example_research_consent", "minimal_nonconsented.json")
-        .read_text()
-    )
+    consent_raw = json.loads(_read_resource("example_research_consent", "minimal_nonconsented.json"))
 
     # add a permit subprovision object for same consent object, after the deny subprovision
     new_permit_subprovision = copy.deepcopy(consent_raw["provision"]["provision"][0])
     new_permit_subprovision["type"] = "permit"
     consent_raw["provision"]["provision"].append(new_permit_subprovision)
 
-    consent = Consent.model_validate_json(json.dumps(consent_raw))
+    consent = Consent.model_validate(consent_raw)
 
     assert not ResearchConsent.consents_to_research(
         [ResearchConsent(scope=consent)], date=date(year=2025, month=10, day=13)
@@ -282,16 +268,12 @@ def test_research_consent_subprovisions_deny_permit():
 
 def test_research_consents_deny_permit():
     """Having two research consents, where deny comes before permit, should return a non-consented state."""
-    consent_raw = json.loads(
-        importlib.resources.files(resources)
-        .joinpath("example_research_consent", "minimal_nonconsented.json")
-        .read_text()
-    )
-    consent1 = Consent.model_validate_json(json.dumps(consent_raw))
+    consent_raw = json.loads(_read_resource("example_research_consent", "minimal_nonconsented.json"))
+    consent1 = Consent.model_validate(consent_raw)
 
     # add a permit consent object for same donor
     consent_raw["provision"]["provision"][0]["type"] = "permit"
-    consent2 = Consent.model_validate_json(json.dumps(consent_raw))
+    consent2 = Consent.model_validate(consent_raw)
 
     assert not ResearchConsent.consents_to_research(
         (ResearchConsent(scope=consent1), ResearchConsent(scope=consent2)), date=date(year=2025, month=10, day=13)
@@ -300,8 +282,6 @@ def test_research_consents_deny_permit():
 
 def test_research_consent_no_subprovisions():
     """Consent objects are allowed to have no provisions under the root."""
-    consent_json_raw = json.loads(
-        importlib.resources.files(resources).joinpath("example_research_consent", "minimal_consented.json").read_text()
-    )
+    consent_json_raw = json.loads(_read_resource("example_research_consent", "minimal_consented.json"))
     del consent_json_raw["provision"]["provision"]
-    Consent.model_validate_json(json.dumps(consent_json_raw))
+    Consent.model_validate(consent_json_raw)
@@ -20,24 +20,33 @@ metadata_incompatible_reference_genomes = resource_files.joinpath(
 metadata_duplicate_run_id = resource_files.joinpath("failing_metadata/duplicate-run-id.json")
 
 
-def test_submission_metadata_fails():
+@pytest.mark.parametrize(
+    "metadata_path,match",
+    [
+        pytest.param(metadata_missing_read_order, "No read order specified for FASTQ file", id="missing-read-order"),
+        pytest.param(metadata_no_target_regions, "BED file missing for lab datum", id="missing-target-regions"),
+        pytest.param(
+            metadata_missing_fastq_r2,
+            "Paired end sequencing layout but not there is not exactly one R1 and one R2",
+            id="missing-fastq-r2",
+        ),
+        pytest.param(
+            metadata_incompatible_reference_genomes,
+            "Incompatible reference genomes found",
+            id="incompatible-reference-genomes",
+        ),
+        pytest.param(
+            metadata_duplicate_run_id,
+            "must have a unique combination of flowcell_id, lane_id, and read_order",
+            id="duplicate-run-id",
+        ),
+    ],
+)
+def test_submission_metadata_fails(metadata_path, match: str):
     error_types = (ValueError, ValidationError, SystemExit)
-    with pytest.raises(error_types, match="No read order specified for FASTQ file"):
-        GrzSubmissionMetadata.model_validate_json(metadata_missing_read_order.read_text())
+    with pytest.raises(error_types, match=match):
+        GrzSubmissionMetadata.model_validate_json(metadata_path.read_text())
 
-    with pytest.raises(error_types, match="BED file missing for lab datum"):
-        GrzSubmissionMetadata.model_validate_json(metadata_no_target_regions.read_text())
 
-    # missing VCF is allowed
+def test_submission_metadata_missing_vcf_allowed():
     GrzSubmissionMetadata.model_validate_json(metadata_missing_vcf_file.read_text())
-
-    with pytest.raises(
-        error_types, match="Paired end sequencing layout but not there is not exactly one R1 and one R2"
-    ):
-        GrzSubmissionMetadata.model_validate_json(metadata_missing_fastq_r2.read_text())
-
-    with pytest.raises(error_types, match="Incompatible reference genomes found"):
-        GrzSubmissionMetadata.model_validate_json(metadata_incompatible_reference_genomes.read_text())
-
-    with pytest.raises(error_types, match="must have a unique combination of flowcell_id, lane_id, and read_order"):
-        GrzSubmissionMetadata.model_validate_json(metadata_duplicate_run_id.read_text())
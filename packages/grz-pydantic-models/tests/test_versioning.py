@@ -1,3 +1,4 @@
+import pytest
 from grz_pydantic_models.submission.metadata.versioning import Version
 
 
@@ -14,3 +15,18 @@ def test_version_comparisons():
 
     assert Version("1") >= Version("1.0")
     assert Version("2.1.0") >= Version("2")
+
+
+def test_version_reuse_and_hash():
+    version = Version("1.2")
+    # comparing must not consume the parsed components
+    assert Version("1.1.1") <= version <= Version("1.3")
+    assert version == Version("1.2.0")
+
+    assert hash(Version("1")) == hash(Version("1.0.0"))
+    assert {Version("1.3"), Version("1.3.0")} == {Version("1.3")}
+
+
+def test_version_invalid():
+    with pytest.raises(ValueError):
+        Version("1.x")
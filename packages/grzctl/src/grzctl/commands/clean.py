@@ -1,16 +1,20 @@
 """Command for cleaning a submission from the S3 inbox."""
 
+import itertools
 import logging
 import sys
 
 import click
 from grz_common.cli import config_file, submission_id
-from grz_common.transfer import init_s3_resource
+from grz_common.transfer import init_s3_client
 
 from ..models.config import CleanConfig
 
 log = logging.getLogger(__name__)
 
+# maximum number of keys S3 accepts in a single DeleteObjects request
+DELETE_OBJECTS_MAX_KEYS = 1000
+
 
 @click.command()
 @submission_id
@@ -23,6 +27,8 @@ def clean(submission_id, config_file, yes_i_really_mean_it: bool):
     config = CleanConfig.from_path(config_file)
     bucket_name = config.s3.bucket
 
+    # normalized once so that the prefix and the marker keys below never contain a doubled slash
+    submission_id = submission_id.rstrip("/")
     if not submission_id:
         sys.exit("No submission ID provided. Please specify a submission ID to clean.")
 
@@ -31,34 +37,46 @@ def clean(submission_id, config_file, yes_i_really_mean_it: bool):
         default=False,
         show_default=True,
     ):
-        prefix = submission_id
-        prefix = prefix + "/" if not prefix.endswith("/") else prefix
+        prefix = f"{submission_id}/"
 
-        resource = init_s3_resource(config.s3)
-        bucket = resource.Bucket(bucket_name)
+        s3_client = init_s3_client(config.s3)
         log.info(f"Cleaning '{prefix}' from '{bucket_name}' …")
         # add a marker at start of cleaning to
         #  1.) ensure user can upload the "cleaned" marker at the end _before_ we start deleting things
         #  2.) detect incomplete cleans if needed
-        bucket.put_object(Body=b"", Key=f"{submission_id}/cleaning")
+        s3_client.put_object(Bucket=bucket_name, Body=b"", Key=f"{submission_id}/cleaning")
 
         # keep metadata.json to prevent future re-uploads
         keys_to_keep = {f"{submission_id}/metadata/metadata.json", f"{submission_id}/cleaning"}
+        # list through the client paginator, which yields plain dicts instead of an ObjectSummary per key
+        pages = s3_client.get_paginator("list_objects_v2").paginate(Bucket=bucket_name, Prefix=prefix)
+        keys_to_delete = (
+            content["Key"]
+            for page in pages
+            for content in page.get("Contents", ())
+            if content["Key"] not in keys_to_keep
+        )
         num_deleted = 0
-        for obj in bucket.objects.filter(Prefix=prefix):
-            if obj.key not in keys_to_keep:
-                _ = obj.delete()
-                num_deleted += 1
+        for batch in itertools.batched(keys_to_delete, DELETE_OBJECTS_MAX_KEYS):
+            response = s3_client.delete_objects(
+                Bucket=bucket_name, Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+            )
+            # quiet mode only reports the keys that failed to delete
+            if errors := response.get("Errors", []):
+                for error in errors:
+                    log.error(f"Failed to delete '{error.get('Key')}': {error.get('Code')} {error.get('Message')}")
+                sys.exit(f"Failed to delete {len(errors)} objects with prefix '{prefix}' from bucket '{bucket_name}'.")
+            num_deleted += len(batch)
         if not num_deleted:
             sys.exit(f"No objects with prefix '{prefix}' in bucket '{bucket_name}' found for deletion.")
 
         log.info(f"Successfully deleted {num_deleted} objects.")
 
         # redact metadata.json since it contains tanG + localCaseId
-        bucket.put_object(Body=b"", Key=f"{submission_id}/metadata/metadata.json")
+        s3_client.put_object(Bucket=bucket_name, Body=b"", Key=f"{submission_id}/metadata/metadata.json")
 
         # mark that we've cleaned this submission
-        bucket.put_object(Body=b"", Key=f"{submission_id}/cleaned")
-        bucket.Object(f"{submission_id}/cleaning").delete()
+        s3_client.put_object(Bucket=bucket_name, Body=b"", Key=f"{submission_id}/cleaned")
+        s3_client.delete_object(Bucket=bucket_name, Key=f"{submission_id}/cleaning")
 
         log.info(f"Cleaned '{prefix}' from '{bucket_name}'.")
@@ -32,18 +32,17 @@ def consent(submission_dir, output_json, show_details, date):
     metadata = SubmissionMetadata(Path(submission_dir) / "metadata" / "metadata.json").content
 
     date = datetime.date.today() if date is None else datetime.date.fromisoformat(date)
-    consents = _gather_consent_information(metadata, date)
-    overall_consent = metadata.consents_to_research(date)
 
+    # each output shows either the per-donor or the overall consent, so only evaluate the one needed
     match output_json, show_details:
         case True, True:
-            json.dump(consents, sys.stdout)
+            json.dump(_gather_consent_information(metadata, date), sys.stdout)
         case True, False:
-            json.dump(overall_consent, sys.stdout)
+            json.dump(metadata.consents_to_research(date), sys.stdout)
         case False, True:
-            _print_rich_table(consents)
+            _print_rich_table(_gather_consent_information(metadata, date))
         case False, False:
-            click.echo(str(overall_consent).lower())
+            click.echo(str(metadata.consents_to_research(date)).lower())
 
 
 def _print_rich_table(consents: dict[str, bool]):
@@ -64,8 +63,4 @@ def _print_rich_table(consents: dict[str, bool]):
 
 
 def _gather_consent_information(metadata: GrzSubmissionMetadata, date: datetime.date) -> dict[str, bool]:
-    consents = {donor.donor_pseudonym: False for donor in metadata.donors}
-    for donor in metadata.donors:
-        consents[donor.donor_pseudonym] = donor.consents_to_research(date)
-
-    return consents
+    return {donor.donor_pseudonym: donor.consents_to_research(date) for donor in metadata.donors}
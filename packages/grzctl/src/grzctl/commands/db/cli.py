@@ -29,6 +29,7 @@ from grz_db.errors import (
     SubmissionNotFoundError,
 )
 from grz_db.models.author import Author
+from grz_db.models.base import load_public_key
 from grz_db.models.submission import (
     ChangeRequestEnum,
     ChangeRequestLog,
@@ -86,16 +87,18 @@ def db(ctx: click.Context, config_file: str):
     else:
         raise ValueError("Either private_key or private_key_path must be provided.")
 
-    from cryptography.hazmat.primitives.serialization import load_ssh_public_key
-
     log.debug("Reading known public keys...")
     KnownKeyEntry = namedtuple("KnownKeyEntry", ["key_format", "public_key_base64", "comment"])
     with open(db_config.known_public_keys) as f:
         public_key_list = list(map(lambda v: KnownKeyEntry(*v), map(lambda s: s.strip().split(), f.readlines())))
-        public_keys = {
-            comment: load_ssh_public_key(f"{fmt}\t{key}\t{comment}".encode()) for fmt, key, comment in public_key_list
-        }
-        for comment in public_keys:
+        public_keys = {}
+        for fmt, key, comment in public_key_list:
+            try:
+                public_keys[comment] = load_public_key(f"{fmt}\t{key}\t{comment}".encode())
+            except TypeError:
+                # signatures are Ed25519 only, so other keys could never verify a log; don't fail every command over one
+                log.warning(f"Ignoring public key labeled '{comment}' since it is not an Ed25519 key ({fmt}).")
+                continue
             log.debug(f"Found public key labeled '{comment}'")
 
     author = Author(
@@ -165,7 +168,7 @@ def list_submissions(ctx: click.Context, output_json: bool, limit: int):
     db_service = get_submission_db_instance(db)
 
     try:
-        submissions = db_service.list_submissions(limit=limit)
+        submissions = db_service.list_submissions_with_latest_state(limit=limit)
     except Exception as e:
         raise click.ClickException(str(e)) from e
 
@@ -184,11 +187,7 @@ def list_submissions(ctx: click.Context, output_json: bool, limit: int):
 
     submission_dicts = []
 
-    for submission in submissions:
-        latest_state_obj: SubmissionStateLog | None = None
-        if submission.states:
-            latest_state_obj = max(submission.states, key=lambda s: s.timestamp)
-
+    for submission, latest_state_obj in submissions:
         latest_state_str = "N/A"
         latest_timestamp_str = "N/A"
         author_name_str = "N/A"
@@ -390,10 +389,9 @@ def update(ctx: click.Context, submission_id: str, state_str: str, data_json: st
             console_err.print(f"[red]Error: Invalid JSON string for --data: {data_json}[/red]")
             raise click.Abort() from e
     try:
-        submission = db_service.get_submission(submission_id)
-        if not submission:
+        latest_state = db_service.get_latest_state(submission_id)
+        if latest_state is None and not db_service.submission_exists(submission_id):
             raise SubmissionNotFoundError(submission_id)
-        latest_state = submission.get_latest_state()
         latest_state_is_error = latest_state is not None and latest_state.state == SubmissionStateEnum.ERROR
         if (
             latest_state_is_error
@@ -443,9 +441,7 @@ def modify(ctx: click.Context, submission_id: str, key: str, value: str):
     db_service = get_submission_db_instance(db, author=ctx.obj["author"])
 
     try:
-        submission = db_service.get_submission(submission_id)
-        if not submission:
-            raise SubmissionNotFoundError(submission_id)
+        # raises SubmissionNotFoundError itself, no separate existence check needed
         _ = db_service.modify_submission(submission_id, key, value)
         console_err.print(f"[green]Updated {key} of submission '{submission_id}'[/green]")
     except SubmissionNotFoundError as e:
@@ -458,13 +454,9 @@ def modify(ctx: click.Context, submission_id: str, key: str, value: str):
         raise click.ClickException(f"Failed to update submission state: {e}") from e
 
 
-def _diff_metadata(
-    submission: Submission, metadata: GrzSubmissionMetadata, ignore_fields: set[str]
-) -> list[tuple[str, Any, Any]]:
-    """Given a database submission and a metadata.json file, report changed fields and their before/after values if they are not in ignore_fields."""
-    changes = []
-
-    simple_fields = {
+# submission fields that are copied one-to-one from the metadata's submission section
+_SIMPLE_SUBMISSION_FIELDS = frozenset(
+    {
         "tan_g",
         "submission_date",
         "submission_type",
@@ -474,8 +466,16 @@ def _diff_metadata(
         "genomic_study_type",
         "genomic_study_subtype",
     }
+)
+
+
+def _diff_metadata(
+    submission: Submission, metadata: GrzSubmissionMetadata, ignore_fields: set[str]
+) -> list[tuple[str, Any, Any]]:
+    """Given a database submission and a metadata.json file, report changed fields and their before/after values if they are not in ignore_fields."""
+    changes = []
 
-    for field in simple_fields - ignore_fields:
+    for field in _SIMPLE_SUBMISSION_FIELDS - ignore_fields:
         if field == "tan_g" and metadata.submission.tan_g == REDACTED_TAN:
             raise ValueError(
                 "Refusing to populate a seemingly-redacted TAN (all zeros). "
@@ -607,7 +607,7 @@ def _diff_donors(
     multiple=True,
 )
 @click.pass_context
-def populate(ctx: click.Context, submission_id: str, metadata_path: str, confirm: bool, ignore_field: list[str]):  # noqa: C901
+def populate(ctx: click.Context, submission_id: str, metadata_path: str, confirm: bool, ignore_field: list[str]):
     """Populate the submission database from a metadata JSON file."""
     log.debug("Ignored fields for populate: %s", ignore_field)
 
@@ -666,10 +666,8 @@ def populate(ctx: click.Context, submission_id: str, metadata_path: str, confirm
     ):
         for key, _before, after in changes:
             _ = db_service.modify_submission(submission_id, key=key, value=after)
-        for added_donor in donor_diff.added:
-            _ = db_service.add_donor(added_donor)
-        for updated_donor in donor_diff.updated:
-            _ = db_service.update_donor(updated_donor)
+        db_service.add_donors(donor_diff.added)
+        db_service.update_donors(donor_diff.updated)
         for deleted_donor in donor_diff.deleted:
             db_service.delete_donor(deleted_donor)
         console_err.print("[green]Database populated successfully.[/green]")
@@ -787,8 +785,7 @@ def populate_qc(ctx: click.Context, submission_id: str, report_csv_path: str, co
     if not confirm or click.confirm(
         "Are you sure you want to commit these changes to the database?", default=False, show_default=True
     ):
-        for result in results:
-            db_service.add_detailed_qc_result(result)
+        db_service.add_detailed_qc_results(results)
 
 
 @submission.command()
@@ -877,8 +874,7 @@ def show(ctx: click.Context, submission_id: str):
         state_table.add_column("Data Steward", style="magenta")
         state_table.add_column("Signature Status")
 
-        sorted_states = sorted(submission.states, key=lambda s: s.timestamp)
-        for state_log in sorted_states:
+        for state_log in submission.states:
             data_str = json.dumps(state_log.data) if state_log.data else ""
             state = state_log.state.value
             state_str = f"[red]{state}[/red]" if state == SubmissionStateEnum.ERROR else state
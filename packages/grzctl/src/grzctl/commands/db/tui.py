@@ -13,7 +13,6 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 from grz_db.models.submission import Submission, SubmissionDb, SubmissionStateLog
 from grz_pydantic_models.submission.metadata import SubmissionType
 from sqlalchemy import func as sqlfn
-from sqlalchemy.orm import selectinload
 from sqlmodel import select
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -222,9 +221,7 @@ class SearchResultsDataTable(DataTable):
                 .group_by(SubmissionStateLog.submission_id)
                 .subquery("latest_state_per_submission")
             )
-            statement = (
-                select(Submission).options(selectinload(Submission.states))  # type: ignore[arg-type]
-            )
+            statement = select(Submission)
             if submission_id:
                 statement = statement.where(Submission.id == submission_id)
             if pseudonym:
@@ -245,7 +242,7 @@ class SearchResultsDataTable(DataTable):
             submissions = session.exec(statement).all()
         logger.debug("Populating search table from the following statement: '%s'", str(statement))
         for submission in submissions:
-            latest_state = max(submission.states, key=lambda st: st.timestamp)
+            latest_state = submission.states[-1]
             self.add_row(submission.id, submission.pseudonym, latest_state.state, latest_state.timestamp)
 
         self.loading = False
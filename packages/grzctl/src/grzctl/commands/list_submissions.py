@@ -12,7 +12,6 @@ import rich.table
 import rich.text
 from grz_common.cli import config_file, output_json
 from grz_common.workers.download import InboxSubmissionState, InboxSubmissionSummary, query_submissions
-from grz_db.models.submission import SubmissionDb
 from pydantic_core import to_jsonable_python
 
 from ..models.config import ListConfig
@@ -26,17 +25,6 @@ log = logging.getLogger(__name__)
 BYTES_PER_GIGABYTE = 1_000_000_000
 
 
-def _get_latest_state_str(submission_db: SubmissionDb, submission_id: str) -> str | None:
-    submission_from_db = submission_db.get_submission(submission_id)
-    if submission_from_db:
-        latest_state_log = submission_from_db.get_latest_state()
-        latest_state = None if latest_state_log is None else latest_state_log.state.value
-    else:
-        latest_state = "missing"
-
-    return latest_state
-
-
 def _get_latest_state_txt(latest_state: str | None) -> rich.text.Text:
     """
     Gets the latest database state of a submission ID as a Rich Text object,
@@ -132,9 +120,15 @@ def list_submissions(config_file: Path, output_json: bool, show_cleaned: bool, l
     if isinstance(config.db, DbModel):
         database_states = {}
         submission_db = get_submission_db_instance(db_url=config.db.database_url)
-        # query latest database state for submissions
+        # query latest database state for all submissions at once
+        latest_states = submission_db.get_latest_states(submission.submission_id for submission in submissions)
         for submission in submissions:
-            database_states[submission.submission_id] = _get_latest_state_str(submission_db, submission.submission_id)
+            if submission.submission_id not in latest_states:
+                database_states[submission.submission_id] = "missing"
+            elif (latest_state_log := latest_states[submission.submission_id]) is not None:
+                database_states[submission.submission_id] = latest_state_log.state.value
+            else:
+                database_states[submission.submission_id] = None
     elif isinstance(config.db, dict):
         # this can happen if environment variables partially populate DbModel but it's missing from the passed config file
         log.debug("Ignoring partial/invalid database configuration.")
@@ -21,10 +21,10 @@ from grz_db.models.submission import (
     Donor,
     Submission,
     SubmissionDb,
-    SubmissionStateEnum,
 )
 from grz_pydantic_models.submission.metadata import GenomicStudyType, Relation, SubmissionType
 from sqlalchemy import func as sqlfn
+from sqlalchemy.orm import raiseload
 from sqlmodel import select
 
 from ..models.config import ReportConfig
@@ -81,7 +81,7 @@ def processed(ctx: click.Context, since: datetime.date | None, until: datetime.d
         # default to a week before 'until'
         since = until - datetime.timedelta(weeks=1)
 
-    submissions = submission_db.list_processed_between(start=since, end=until)
+    submissions = submission_db.list_reported_processed_between(start=since, end=until)
 
     status_map: dict[bool | None, str] = {
         True: "yes",
@@ -91,17 +91,14 @@ def processed(ctx: click.Context, since: datetime.date | None, until: datetime.d
 
     click.echo(f"# Submissions processed between {since} and {until}")
     click.echo(separator.join(["Submission ID", "Basic QC Passed", "Detailed QC Passed", "Prüfbericht Submitted"]))
-    for submission in submissions:
-        last_reported_state_change = submission.get_latest_state(filter_to_type=SubmissionStateEnum.REPORTED)
-        if not last_reported_state_change:
-            continue
+    for submission_id, basic_qc_passed, detailed_qc_passed, last_reported in submissions:
         click.echo(
             separator.join(
                 [
-                    submission.id,
-                    status_map[submission.basic_qc_passed],
-                    status_map[submission.detailed_qc_passed],
-                    last_reported_state_change.timestamp.date().isoformat(),
+                    submission_id,
+                    status_map[basic_qc_passed],
+                    status_map[detailed_qc_passed],
+                    last_reported.date().isoformat(),
                 ]
             )
         )
@@ -378,7 +375,8 @@ def _dump_dataset_report(output_path: Path, database: SubmissionDb, year: int, q
         query_quarter_submissions = (
             select(Submission).where(Submission.submission_date.between(quarter_start_date, quarter_end_date))  # type: ignore[union-attr]
         )
-        submissions = session.exec(query_quarter_submissions).all()
+        # the state history isn't part of the report
+        submissions = session.exec(query_quarter_submissions.options(raiseload("*"))).all()
 
         subquery_quarter_submissions = query_quarter_submissions.subquery()
         query_donors = select(Donor).join(
@@ -488,7 +486,9 @@ def _dump_qc_report(output_path: Path, database: SubmissionDb, year: int, quarte
             .where(Submission.submission_date.between(quarter_start_date, quarter_end_date))  # type: ignore[union-attr]
             .filter(sa.not_(Submission.detailed_qc_passed))  # type: ignore[call-overload]
         )
-        submissions_that_failed_detailed_qc = session.exec(query_submissions_that_failed_detailed_qc).all()
+        submissions_that_failed_detailed_qc = session.exec(
+            query_submissions_that_failed_detailed_qc.options(raiseload("*"))
+        ).all()
 
         subquery_submissions_that_failed_detailed_qc = query_submissions_that_failed_detailed_qc.subquery()
         query_reports_of_failed_submissions = select(DetailedQCResult).join(
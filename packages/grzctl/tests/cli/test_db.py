@@ -12,12 +12,31 @@ from pathlib import Path
 from textwrap import dedent
 
 import click.testing
+import cryptography.hazmat.primitives.serialization as cryptser
 import grzctl.cli
 import pytest
 import yaml
-from grz_db.models.submission import SubmissionDb
-from grz_pydantic_models.submission.metadata import REDACTED_TAN, GrzSubmissionMetadata
+from cryptography.hazmat.primitives.asymmetric import ec
+from grz_db.errors import DuplicateSubmissionError, SubmissionNotFoundError
+from grz_db.models.author import Author
+from grz_db.models.base import load_public_key
+from grz_db.models.submission import (
+    DetailedQCResult,
+    Donor,
+    Submission,
+    SubmissionDb,
+    SubmissionStateEnum,
+)
+from grz_pydantic_models.submission.metadata import (
+    REDACTED_TAN,
+    GrzSubmissionMetadata,
+    LibraryType,
+    Relation,
+    SequenceSubtype,
+    SequenceType,
+)
 from grzctl.models.config import DbConfig
+from pydantic import ValidationError
 
 from .. import resources as test_resources
 
@@ -282,6 +301,32 @@ def test_update_error_confirm(blank_database_config_path: Path):
     assert result_update3.exit_code == 0, result_update3.output
 
 
+def test_non_ed25519_known_key_ignored(blank_database_config_path: Path):
+    """A known public key that can't verify signatures shouldn't break db commands."""
+    config = DbConfig.from_path(blank_database_config_path).db
+    assert config is not None
+    other_public_key = ec.generate_private_key(ec.SECP256R1()).public_key()
+    with open(config.known_public_keys, "ab") as known_public_keys_file:
+        known_public_keys_file.write(b"\n")
+        known_public_keys_file.write(
+            other_public_key.public_bytes(encoding=cryptser.Encoding.OpenSSH, format=cryptser.PublicFormat.OpenSSH)
+        )
+        known_public_keys_file.write(b" bob\n")
+
+    args_common = ["db", "--config-file", blank_database_config_path]
+    submission_id = "123456789_2025-07-01_a1b2c3d4"
+    runner = click.testing.CliRunner()
+    cli = grzctl.cli.build_cli()
+    result_add = runner.invoke(cli, [*args_common, "submission", "add", submission_id])
+    assert result_add.exit_code == 0, result_add.output
+    result_update = runner.invoke(cli, [*args_common, "submission", "update", submission_id, "Uploaded"])
+    assert result_update.exit_code == 0, result_update.output
+
+    result_show = runner.invoke(cli, [*args_common, "submission", "show", submission_id])
+    assert result_show.exit_code == 0, result_show.output
+    assert "Verified" in result_show.output
+
+
 def test_list_sort(blank_database_config_path: Path):
     """
     List command should sort in the expected order:
@@ -318,3 +363,187 @@ def test_list_sort(blank_database_config_path: Path):
     result_list_parsed = json.loads(result_list.stdout)
     for i, submission in enumerate(expected_ordering):
         assert submission["id"] == result_list_parsed[i]["id"]
+
+
+def test_bulk_load(blank_database_config_path: Path):
+    """Bulk loading should insert submissions, donors, and detailed QC results in dependency order."""
+    with open(blank_database_config_path, encoding="utf-8") as blank_database_config_file:
+        config = yaml.load(blank_database_config_file, Loader=yaml.Loader)
+    db = SubmissionDb(db_url=config["db"]["database_url"], author=None)
+
+    submission_ids = [f"123456789_2025-07-01_a1b2c3d{i}" for i in range(3)]
+    db.bulk_load(
+        # deliberately out of dependency order and smaller than the number of rows
+        detailed_qc_results=[
+            DetailedQCResult(
+                submission_id=submission_id,
+                lab_datum_id="index0_germline0",
+                pseudonym="index",
+                sequence_type=SequenceType.dna,
+                sequence_subtype=SequenceSubtype.germline,
+                library_type=LibraryType.wgs,
+                percent_bases_above_quality_threshold_minimum_quality=30,
+                percent_bases_above_quality_threshold_percent=90.7,
+                percent_bases_above_quality_threshold_passed_qc=True,
+                percent_bases_above_quality_threshold_percent_deviation=3.0,
+                mean_depth_of_coverage=49.8,
+                mean_depth_of_coverage_passed_qc=True,
+                mean_depth_of_coverage_percent_deviation=-0.3,
+                targeted_regions_min_coverage=20,
+                targeted_regions_above_min_coverage=1.0,
+                targeted_regions_above_min_coverage_passed_qc=True,
+                targeted_regions_above_min_coverage_percent_deviation=0.0,
+            )
+            for submission_id in submission_ids
+        ],
+        donors=[
+            Donor.model_validate(
+                {
+                    "submission_id": submission_id,
+                    "pseudonym": "index",
+                    "relation": Relation.index_,
+                    "library_types": {LibraryType.wgs},
+                    "sequence_types": {SequenceType.dna},
+                    "sequence_subtypes": {SequenceSubtype.germline},
+                    "mv_consented": True,
+                    "research_consented": False,
+                }
+            )
+            for submission_id in submission_ids
+        ],
+        submissions=[Submission(id=submission_id) for submission_id in submission_ids],
+        batch_size=2,
+    )
+
+    assert len(db.list_submissions(limit=None)) == len(submission_ids)
+    assert sorted(submission.id for submission in db.iter_submissions(batch_size=2)) == submission_ids
+    for submission_id in submission_ids:
+        (donor,) = db.get_donors(submission_id)
+        assert donor.library_types == {LibraryType.wgs}
+        assert all(type(library_type) is LibraryType for library_type in donor.library_types)
+        assert len(db.get_detailed_qc_results(submission_id)) == 1
+        assert len(list(db.iter_detailed_qc_results(submission_id, batch_size=1))) == 1
+
+
+def test_donor_batches(blank_database_config_path: Path):
+    """Batched donor writes should add new donors and overwrite existing ones in place."""
+    with open(blank_database_config_path, encoding="utf-8") as blank_database_config_file:
+        config = yaml.load(blank_database_config_file, Loader=yaml.Loader)
+    db = SubmissionDb(db_url=config["db"]["database_url"], author=None)
+
+    submission_id = "123456789_2025-07-01_a1b2c3d4"
+    db.add_submission(submission_id)
+
+    def make_donor(pseudonym: str, relation: Relation, research_consented: bool) -> Donor:
+        return Donor.model_validate(
+            {
+                "submission_id": submission_id,
+                "pseudonym": pseudonym,
+                "relation": relation,
+                "library_types": {LibraryType.wgs},
+                "sequence_types": {SequenceType.dna},
+                "sequence_subtypes": {SequenceSubtype.germline},
+                "mv_consented": True,
+                "research_consented": research_consented,
+            }
+        )
+
+    assert (
+        db.add_donors(
+            [make_donor("index", Relation.index_, False), make_donor("mother", Relation.mother, False)],
+            batch_size=1,
+        )
+        == 2
+    )
+    assert db.update_donors([make_donor("index", Relation.index_, True)]) == 1
+
+    donors = sorted(db.get_donors(submission_id), key=attrgetter("pseudonym"))
+    assert [donor.pseudonym for donor in donors] == ["index", "mother"]
+    assert donors[0].research_consented
+    assert donors[1].library_types == {LibraryType.wgs}
+
+    updated = db.update_donor(make_donor("mother", Relation.mother, True))
+    assert updated.research_consented
+    assert updated.sequence_types == {SequenceType.dna}
+    with pytest.raises(RuntimeError, match="doesn't yet exist"):
+        db.update_donor(make_donor("father", Relation.father, True))
+
+    assert (
+        db.update_donors([make_donor("index", Relation.index_, False), make_donor("mother", Relation.mother, False)])
+        == 2
+    )
+    with pytest.raises(RuntimeError, match="doesn't yet exist"):
+        db.update_donors([make_donor("index", Relation.index_, True), make_donor("father", Relation.father, True)])
+    donors = db.get_donors(submission_id, pseudonym=["index", "mother"])
+    assert sorted(donor.pseudonym for donor in donors) == ["index", "mother"]
+    assert not any(donor.research_consented for donor in donors)
+    assert db.get_donors(submission_id, pseudonym="mother") == (
+        donors[1] if donors[1].pseudonym == "mother" else donors[0],
+    )
+
+
+def test_update_submission_states(blank_database_config_path: Path):
+    """Batched state updates should be signed, returned in order, and rejected as a whole for unknown submissions."""
+    config = DbConfig.from_path(blank_database_config_path).db
+    author = Author(
+        name=config.author.name,
+        private_key_bytes=Path(config.author.private_key_path).read_bytes(),
+        private_key_passphrase=config.author.private_key_passphrase,
+    )
+    db = SubmissionDb(db_url=config.database_url, author=author)
+    submission_ids = [f"123456789_2025-07-01_a1b2c3d{i}" for i in range(3)]
+    assert db.add_submissions(submission_ids, batch_size=2) == len(submission_ids)
+    with pytest.raises(DuplicateSubmissionError):
+        db.add_submissions(["123456789_2025-07-01_a1b2c3d9", submission_ids[2]], batch_size=1)
+    assert not db.submission_exists("123456789_2025-07-01_a1b2c3d9")
+    # malformed IDs are rejected like constructing a Submission would
+    with pytest.raises(ValidationError, match="does not match the required pattern"):
+        db.add_submission("not-a-submission-id")
+    with pytest.raises(ValidationError, match="does not match the required pattern"):
+        db.add_submissions(["123456789_2025-07-01_a1b2c3d9", "not-a-submission-id"])
+    assert not db.submission_exists("123456789_2025-07-01_a1b2c3d9")
+
+    updates = [(submission_id, SubmissionStateEnum.UPLOADED, None) for submission_id in submission_ids]
+    updates.append((submission_ids[0], SubmissionStateEnum.DOWNLOADING, {"attempt": 1}))
+    state_logs = db.update_submission_states(updates, batch_size=2)
+
+    public_key = load_public_key(Path(config.known_public_keys).read_bytes())
+    assert [(log.submission_id, log.state, log.data) for log in state_logs] == updates
+    assert all(log.id is not None and log.verify(public_key) for log in state_logs)
+    stored_logs = SubmissionDb(db_url=config.database_url, author=None).get_submission(submission_ids[0]).states
+    assert all(log.verify(public_key) for log in stored_logs)
+    stored_logs[-1].data = {"attempt": 2}
+    assert not stored_logs[-1].verify(public_key)
+
+    with pytest.raises(SubmissionNotFoundError):
+        db.update_submission_states(
+            [
+                (submission_ids[1], SubmissionStateEnum.DOWNLOADED, None),
+                ("does_not_exist", SubmissionStateEnum.ERROR, None),
+            ]
+        )
+    assert db.get_latest_state(submission_ids[1]).state == SubmissionStateEnum.UPLOADED
+    assert db.get_latest_state(submission_ids[0]).state == SubmissionStateEnum.DOWNLOADING
+    assert db.get_latest_state(submission_ids[0], SubmissionStateEnum.UPLOADED).id == state_logs[0].id
+    assert db.get_latest_state(submission_ids[0], SubmissionStateEnum.ERROR) is None
+
+    latest_states = {
+        submission.id: latest_state.state for submission, latest_state in db.list_submissions_with_latest_state(None)
+    }
+    assert latest_states == {
+        submission_ids[0]: SubmissionStateEnum.DOWNLOADING,
+        submission_ids[1]: SubmissionStateEnum.UPLOADED,
+        submission_ids[2]: SubmissionStateEnum.UPLOADED,
+    }
+
+    latest_states = db.get_latest_states([*submission_ids, "123456789_2025-07-01_ffffffff"])
+    assert {submission_id: log.state for submission_id, log in latest_states.items()} == {
+        submission_ids[0]: SubmissionStateEnum.DOWNLOADING,
+        submission_ids[1]: SubmissionStateEnum.UPLOADED,
+        submission_ids[2]: SubmissionStateEnum.UPLOADED,
+    }
+
+    # a submission fetched again must reflect its latest state
+    assert db.get_submission(submission_ids[2]).get_latest_state().state == SubmissionStateEnum.UPLOADED
+    db.update_submission_state(submission_ids[2], SubmissionStateEnum.DOWNLOADING)
+    assert db.get_submission(submission_ids[2]).get_latest_state().state == SubmissionStateEnum.DOWNLOADING
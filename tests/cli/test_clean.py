@@ -9,13 +9,16 @@ from unittest import mock
 
 import click.testing
 import grzctl
+import pytest
 from grz_common.progress import EncryptionState, FileProgressLogger
 from grz_common.workers.submission import Submission
 
 from .. import mock_files
 
 
-def test_clean_and_list(temp_s3_config_file_path, remote_bucket, working_dir_path, tmp_path):
+# a trailing slash on the submission ID must not change which objects are cleaned
+@pytest.mark.parametrize("submission_id_suffix", ["", "/"], ids=["plain", "trailing-slash"])
+def test_clean_and_list(temp_s3_config_file_path, remote_bucket, working_dir_path, tmp_path, submission_id_suffix):
     submission_dir_ptr = importlib.resources.files(mock_files).joinpath("submissions", "valid_submission")
     with importlib.resources.as_file(submission_dir_ptr) as submission_dir:
         shutil.copytree(submission_dir / "files", working_dir_path / "files", dirs_exist_ok=True)
@@ -63,7 +66,7 @@ def test_clean_and_list(temp_s3_config_file_path, remote_bucket, working_dir_pat
         clean_args = [
             "clean",
             "--submission-id",
-            submission_id,
+            submission_id + submission_id_suffix,
             "--config-file",
             temp_s3_config_file_path,
             "--yes-i-really-mean-it",